@@ -3,9 +3,7 @@ import sys
 from typing import Optional
 from pathlib import Path
 from loguru import logger
-from snkmt.core.db.session import Database
 from snkmt.core.config import DatabaseConfig
-from beaupy import select_multiple, confirm
 from rich.console import Console
 from rich.table import Table
 
@@ -120,6 +118,8 @@ def db_info(
     verbose: bool = VerboseOption,
 ):
     """Display database information and schema version."""
+    from snkmt.core.db.session import Database
+
     database = Database(db, create_db=False, auto_migrate=False)
     print(f"Database info: {database.get_db_info()}")
 
@@ -135,6 +135,8 @@ def db_migrate(
     verbose: bool = VerboseOption,
 ):
     """Run database migrations to upgrade schema to latest version."""
+    from snkmt.core.db.session import Database
+
     database = Database(db, create_db=False, auto_migrate=False, ignore_version=True)
     database.migrate()
 
@@ -283,6 +285,8 @@ def config_add(
     ),
 ):
     """Add a database to the configuration file."""
+    from beaupy import confirm
+
     db_path = Path(path).resolve()
 
     if not db_path.exists():
@@ -305,6 +309,8 @@ def config_add(
 @config_app.command("remove")
 def config_remove():
     """Interactively remove databases from the configuration file."""
+    from beaupy import select_multiple
+
     config = DatabaseConfig()
     databases = config.list_databases()
 
@@ -335,6 +341,8 @@ def config_discover(
     ),
 ):
     """Search for database files recursively and add them to configuration."""
+    from beaupy import select_multiple
+
     search_dir = Path(directory) if directory else Path.cwd()
 
     if not search_dir.exists():
@@ -4,7 +4,9 @@ from textual.reactive import reactive
 from textual.widgets import Input, Label, Select
 from textual import on, work
 from textual.css.query import NoMatches
-from typing import Union, cast
+from collections import OrderedDict
+from typing import Optional, Union, cast
+from time import monotonic
 from snkmt.core.repository import WorkflowRepository
 from snkmt.console.widgets import (
     RuleTable,
@@ -12,9 +14,53 @@ from snkmt.console.widgets import (
     WorkflowDetailOverview,
     WorkflowErrors,
 )
+from snkmt.types.dto import WorkflowDTO
 from snkmt.types.enums import Status, DateFilter
 from uuid import UUID
 
+# How long a cached workflow may be shown on reselect without a refetch
+_WORKFLOW_CACHE_TTL = 1.0
+# How many recently fetched or updated workflows are kept
+_WORKFLOW_CACHE_SIZE = 64
+
+
+class _WorkflowCache:
+    """Small LRU cache of recently fetched workflows, each stamped with the
+    monotonic time it was fetched."""
+
+    def __init__(
+        self, maxsize: int = _WORKFLOW_CACHE_SIZE, ttl: float = _WORKFLOW_CACHE_TTL
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[UUID, tuple[float, WorkflowDTO]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, workflow_id: UUID) -> Optional[WorkflowDTO]:
+        """Return the cached workflow if it was fetched within the TTL."""
+        cached = self._entries.get(workflow_id)
+        if cached is None:
+            return None
+        if monotonic() - cached[0] >= self.ttl:
+            del self._entries[workflow_id]
+            return None
+        return cached[1]
+
+    def put(self, workflow: WorkflowDTO, fetched_at: Optional[float] = None) -> None:
+        """Cache a workflow, evicting the least recently stored past maxsize."""
+        self._entries[workflow.id] = (
+            monotonic() if fetched_at is None else fetched_at,
+            workflow,
+        )
+        self._entries.move_to_end(workflow.id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, workflow_id: UUID) -> None:
+        self._entries.pop(workflow_id, None)
+
 
 class OverviewContainer(Horizontal):
     BINDINGS = [
@@ -29,7 +75,8 @@ class OverviewContainer(Horizontal):
         self.total_workflows = 0
         self.filtered_workflows = 0
         self.hidden_workflows = 0
-        self.selected_workflow = None
+        self.selected_workflow: UUID | None = None
+        self._workflow_cache = _WorkflowCache()
 
     def force_refresh(self) -> None:
         """Force refresh all visible tables in the current view."""
@@ -94,13 +141,13 @@ class OverviewContainer(Horizontal):
         self, message: WorkflowTable.UpdatedWorkflows
     ) -> None:
         """Handle workflow updates and set workflow data directly."""
+        fetched_at = monotonic()
+        for workflow in message.workflows:
+            self._workflow_cache.put(workflow, fetched_at)
+
         if self.selected_workflow:
             selected_workflow_data = next(
-                (
-                    w
-                    for w in message.workflows
-                    if str(w.id) == str(self.selected_workflow)
-                ),
+                (w for w in message.workflows if w.id == self.selected_workflow),
                 None,
             )
             if selected_workflow_data:
@@ -111,29 +158,49 @@ class OverviewContainer(Horizontal):
     @work(exclusive=True)
     async def handle_workflow_selected(self, event: WorkflowTable.RowSelected) -> None:
         """Handle row selection (clicking or pressing enter)."""
-        workflow_id = event.row_key.value
+        workflow_id = UUID(event.row_key.value)
         self.log.debug(f"Selected workflow: {workflow_id}")
-        self.selected_workflow = workflow_id
+        if workflow_id == self.selected_workflow:
+            # Already shown, and kept current by the refresh ticks
+            return
 
         if self.repo:
             try:
-                workflow_data = await self.repo.get(UUID(workflow_id))
+                workflow_data = await self._get_workflow(workflow_id)
                 if workflow_data:
-                    detail_overview = self.query_one(WorkflowDetailOverview)
-                    detail_overview.workflow_data = workflow_data
+                    # Only marked selected once shown, so a reselect while the
+                    # fetch above is in flight isn't skipped
+                    self.selected_workflow = workflow_id
+                    with self.app.batch_update():
+                        detail_overview = self.query_one(WorkflowDetailOverview)
+                        detail_overview.workflow_data = workflow_data
 
-                    rule_table = self.query_one(RuleTable)
-                    rule_table.display = True
-                    rule_table.workflow_id = UUID(workflow_id)
+                        rule_table = self.query_one(RuleTable)
+                        rule_table.display = True
+                        rule_table.workflow_id = workflow_id
 
-                    rules_placeholder = self.query_one("#rules-placeholder")
-                    rules_placeholder.display = False
+                        rules_placeholder = self.query_one("#rules-placeholder")
+                        rules_placeholder.display = False
 
-                    error_container = self.query_one(WorkflowErrors)
-                    error_container.workflow_id = UUID(workflow_id)
+                        error_container = self.query_one(WorkflowErrors)
+                        error_container.workflow_id = workflow_id
             except NoMatches as e:
                 self.log.debug(f"Error fetching workflow {workflow_id}: {e}")
 
+    async def _get_workflow(self, workflow_id: UUID) -> Optional[WorkflowDTO]:
+        """Get a workflow, reusing a recent fetch or update if there is one."""
+        cached = self._workflow_cache.get(workflow_id)
+        if cached:
+            return cached
+
+        assert self.repo is not None
+        workflow = await self.repo.get(workflow_id)
+        if workflow:
+            self._workflow_cache.put(workflow)
+        else:
+            self._workflow_cache.discard(workflow_id)
+        return workflow
+
     def compose(self) -> ComposeResult:
         if self.repo:
             # Left panel - Workflows table
@@ -1,5 +1,9 @@
+import os
+from contextlib import aclosing
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, AsyncGenerator, List, Optional, Self, Union
 from uuid import UUID
 from textual import work
 from textual.reactive import reactive
@@ -15,7 +19,13 @@ from textual.widgets import (
     Log,
 )
 from textual.screen import ModalScreen
-from textual.widgets.data_table import RowKey, CellDoesNotExist, DuplicateKey
+from textual.widgets.data_table import (
+    CellType,
+    ColumnKey,
+    RowKey,
+    CellDoesNotExist,
+    DuplicateKey,
+)
 from datetime import datetime, timezone
 from rich.text import TextType, Text
 from textual.app import ComposeResult
@@ -25,38 +35,99 @@ from snkmt.types.enums import Status, DateFilter
 from snkmt.core.repository import WorkflowRepository
 
 
-class StyledProgress(Text):
-    def __init__(self, progress: float) -> None:
-        progstr = format(progress, ".2%")
+def _format_timestamp(timestamp: datetime) -> str:
+    """Format as YYYY-MM-DD HH:MM:SS, dropping any UTC offset."""
+    # isoformat is much cheaper than strftime, which reparses its format
+    return timestamp.isoformat(" ", "seconds")[:19]
 
-        if progress < 0.2:
-            color = "#fb4b4b"
-        elif progress < 0.4:
-            color = "#ffa879"
-        elif progress < 0.6:
-            color = "#ffc163"
-        elif progress < 0.8:
-            color = "#feff5c"
-        else:
-            color = "#c0ff33"
-        super().__init__(progstr, style=color)
-
-
-class StyledStatus(Text):
-    def __init__(self, status: Status) -> None:
-        status_str = status.value.capitalize()
-        if status == Status.RUNNING:
-            color = "#ffc163"
-        elif status == Status.SUCCESS:
-            color = "#c0ff33"
-        elif status == Status.ERROR:
-            color = "#fb4b4b"
-        else:
-            color = "#b0b0b0"
-        super().__init__(status_str, style=color)
 
+# Progress below each threshold gets the color at the same index, the rest
+# get the last one
+_PROGRESS_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+_PROGRESS_COLORS = ("#fb4b4b", "#ffa879", "#ffc163", "#feff5c", "#c0ff33")
+
+_STATUS_COLORS = {
+    Status.RUNNING: "#ffc163",
+    Status.SUCCESS: "#c0ff33",
+    Status.ERROR: "#fb4b4b",
+}
+
+
+@lru_cache(maxsize=1024)
+def styled_progress(progress: float) -> Text:
+    """Colored percentage. The returned Text is shared and must not be mutated."""
+    return Text(
+        format(progress, ".2%"),
+        style=_PROGRESS_COLORS[bisect_right(_PROGRESS_THRESHOLDS, progress)],
+    )
+
+
+@lru_cache(maxsize=None)
+def styled_status(status: Status) -> Text:
+    """Colored status label. The returned Text is shared and must not be mutated."""
+    return Text(status.value.capitalize(), style=_STATUS_COLORS.get(status, "#b0b0b0"))
+
+
+class UpdatingDataTable(DataTable):
+    """DataTable that remembers the cells written to each row, so updates only
+    touch the cells that changed."""
+
+    _column_keys: list[ColumnKey]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # Last cells written per row key, used to diff updates. Its keys are
+        # also the table's row keys as plain strings, cheaper to test than
+        # self.rows' RowKeys.
+        self._last_rows: dict[str, tuple[Any, ...]] = {}
+        super().__init__(*args, **kwargs)
+
+    def add_row(
+        self,
+        *cells: CellType,
+        height: int | None = 1,
+        key: str | None = None,
+        label: TextType | None = None,
+    ) -> RowKey:
+        row_key = super().add_row(*cells, height=height, key=key, label=label)
+        # Rows added without a key can't be updated by key, so aren't tracked
+        if row_key.value is not None:
+            self._last_rows[row_key.value] = cells
+        return row_key
+
+    def remove_row(self, row_key: RowKey | str) -> None:
+        super().remove_row(row_key)
+        key = row_key.value if isinstance(row_key, RowKey) else row_key
+        if key is not None:
+            self._last_rows.pop(key, None)
+
+    def clear(self, columns: bool = False) -> Self:
+        self._last_rows.clear()
+        return super().clear(columns)
+
+    def _update_row(self, key: str, row_data: List[TextType]) -> None:
+        """Update a single row, adding it if it doesn't exist.
+
+        Diffs against the last cells written to the row so only changed cells
+        are repainted.
+        """
+        previous = self._last_rows.get(key)
+        if previous is None:
+            self.add_row(*row_data, key=key)
+            return
+
+        new_row = tuple(row_data)
+        if new_row == previous:
+            return
+
+        # Styled cells are interned, so an identity check settles most
+        # columns without going through Text.__eq__
+        for column_key, new_val, old_val in zip(self._column_keys, new_row, previous):
+            if new_val is not old_val and new_val != old_val:
+                self.update_cell(key, column_key, new_val, update_width=False)
+        self._last_rows[key] = new_row
 
-class RuleTable(DataTable):
+
+class RuleTable(UpdatingDataTable):
     workflow_id: reactive[UUID | None] = reactive(None, layout=True)
 
     def __init__(self, repo: WorkflowRepository, *args, **kwargs):
@@ -80,11 +151,16 @@ class RuleTable(DataTable):
         if self.app.refresh_interval > 0:  # type: ignore
             self.set_interval(self.app.refresh_interval, self.update_rules)  # type: ignore
 
-    @work(exclusive=True)
+    @work(exclusive=True, group="update")
     async def update_rules(self) -> None:
         if self.workflow_id is None:
             return
 
+        # Cheap probe; skip the refresh entirely if no rule changed
+        last_updated_at = await self.repo.last_rule_updated_at(self.workflow_id)
+        if last_updated_at == self.last_update:
+            return
+
         rules = await self.repo.list_rules(
             workflow_id=self.workflow_id,
             status=None,
@@ -92,36 +168,40 @@ class RuleTable(DataTable):
         )
 
         # Check for new rules
-        has_new_rules = any(r.name not in self.rows for r in rules)
+        has_new_rules = any(r.name not in self._last_rows for r in rules)
 
         if has_new_rules:
             # Refresh table to get proper ordering
             self._refresh_table()
         else:
             # Only update existing rules
-            for rule in rules:
-                if rule.name not in self.rows:
-                    continue
-                row_data = self._rule_to_row(rule)
-                self._update_row(rule.name, row_data)
+            with self.app.batch_update():
+                for rule in rules:
+                    if rule.name not in self._last_rows:
+                        continue
+                    row_data = self._rule_to_row(rule)
+                    self._update_row(rule.name, row_data)
 
-        self.last_update = datetime.now(timezone.utc)
+        # Track the DB-side timestamp rather than the local clock
+        self.last_update = last_updated_at
 
-    @work(exclusive=True)
+    @work(exclusive=True, group="refresh")
     async def _refresh_table(self) -> None:
         if self.workflow_id is None:
             return
 
-        self.clear()
-
         rules = await self.repo.list_rules(
             workflow_id=self.workflow_id,
             status=None,
         )
 
-        for rule in rules:
-            row_data = self._rule_to_row(rule)
-            self.add_row(*row_data, key=rule.name)
+        # Rows are built up front so the table is swapped in one repaint, and
+        # cleared only once the data is in so it never sits empty
+        rows = [(rule.name, self._rule_to_row(rule)) for rule in rules]
+        with self.app.batch_update():
+            self.clear()
+            for key, row_data in rows:
+                self.add_row(*row_data, key=key)
 
     def _rule_to_row(self, rule: RuleDTO) -> List[TextType]:
         # Calculate progress as jobs_finished / total_job_count
@@ -133,7 +213,7 @@ class RuleTable(DataTable):
 
         return [
             rule.name,
-            StyledProgress(progress),
+            styled_progress(progress),
             str(rule.total_job_count),
             str(rule.jobs_finished),
             str(rule.job_counts.running),
@@ -141,26 +221,12 @@ class RuleTable(DataTable):
             str(rule.job_counts.failed),
         ]
 
-    def _update_row(self, key: str, row_data: List[TextType]) -> None:
-        """Update a single row, adding it if it doesn't exist."""
-        if key not in self.rows:
-            self.add_row(*row_data, key=key)
-        else:
-            existing_row = self.get_row(key)
-            if existing_row != row_data:
-                for col_idx, (new_val, old_val) in enumerate(
-                    zip(row_data, existing_row)
-                ):
-                    if new_val != old_val:
-                        column_key = self._column_keys[col_idx]
-                        self.update_cell(key, column_key, new_val)
-
     def watch_workflow_id(self) -> None:
         """Called when workflow_id changes."""
         self._refresh_table()
 
 
-class WorkflowTable(DataTable):
+class WorkflowTable(UpdatingDataTable):
     BINDINGS = [
         ("enter", "select_cursor", "Select"),
         ("h", "hide_selected", "Hide Selected"),
@@ -195,6 +261,8 @@ class WorkflowTable(DataTable):
             super().__init__()
 
     def __init__(self, repo: WorkflowRepository, *args, **kwargs):
+        # Raw values each row was rendered from, to skip building unchanged rows
+        self._row_inputs: dict[str, tuple] = {}
         super().__init__(*args, **kwargs)
 
         self.repo = repo
@@ -213,8 +281,13 @@ class WorkflowTable(DataTable):
         if self.app.refresh_interval > 0:  # type: ignore
             self.set_interval(self.app.refresh_interval, self.update_workflows)  # type: ignore
 
-    @work(exclusive=True)
+    @work(exclusive=True, group="update")
     async def update_workflows(self) -> None:
+        # Cheap indexed probe; skip the refresh entirely if nothing changed
+        last_updated_at = await self.repo.last_updated_at()
+        if last_updated_at == self.last_update:
+            return
+
         workflows = await self.repo.list(
             since=self.last_update,
             name=self.name_filter or None,
@@ -222,10 +295,13 @@ class WorkflowTable(DataTable):
             started_at=self.date_filter if self.date_filter != DateFilter.ANY else None,
         )
         self.post_message(self.UpdatedWorkflows(workflows))
+        # Stringify each UUID once, it is both the row key and the short id
+        keyed_workflows = [(str(w.id), w) for w in workflows]
+
         # Check for new workflows
         has_new_workflows = any(
-            str(w.id) not in self.hidden_rows and str(w.id) not in self.rows
-            for w in workflows
+            workflow_id not in self.hidden_rows and workflow_id not in self._last_rows
+            for workflow_id, _ in keyed_workflows
         )
 
         if has_new_workflows:
@@ -233,44 +309,66 @@ class WorkflowTable(DataTable):
             self._refresh_table()
         else:
             # Only update existing visible workflows
-            for workflow in workflows:
-                workflow_id = str(workflow.id)
-                if workflow_id not in self.rows:
-                    continue
-                row_data = self._workflow_to_row(workflow)
-                self._update_row(workflow_id, row_data)
-
-        self.last_update = datetime.now(timezone.utc)
-
-    @work(exclusive=True)
+            with self.app.batch_update():
+                for workflow_id, workflow in keyed_workflows:
+                    if workflow_id not in self._last_rows:
+                        continue
+                    row_inputs = self._row_inputs_for(workflow)
+                    if self._row_inputs.get(workflow_id) == row_inputs:
+                        continue
+                    row_data = self._workflow_to_row(workflow_id, workflow)
+                    self._update_row(workflow_id, row_data)
+                    self._row_inputs[workflow_id] = row_inputs
+
+        # Track the DB-side timestamp rather than the local clock
+        self.last_update = last_updated_at
+
+    @work(exclusive=True, group="refresh")
     async def _refresh_table(self) -> None:
-        self.clear()
+        total_count = await self.repo.count()
 
-        workflows = await self.repo.list(
+        # Rows are streamed in batches, so large histories never sit in memory
+        # all at once and the first rows show up early
+        filtered_count = 0
+        cleared = False
+        stream: AsyncGenerator[list[WorkflowDTO], None] = self.repo.list_batches(
             name=self.name_filter or None,
             status=self.status_filter if self.status_filter != "all" else None,
             started_at=self.date_filter if self.date_filter != DateFilter.ANY else None,
         )
-
-        total_count = await self.repo.count()
-
-        for workflow in workflows:
-            workflow_id = str(workflow.id)
-            if workflow_id not in self.hidden_rows and workflow_id not in self.rows:
-                row_data = self._workflow_to_row(workflow)
-                try:
-                    self.add_row(*row_data, key=workflow_id)
-                except DuplicateKey:
-                    self.log.debug(
-                        f"Duplicated workflowid when refreshing table: {workflow_id}"
-                    )
-                    return
-
-        self._last_filtered_count = len(workflows)
+        async with aclosing(stream) as batches:
+            async for workflows in batches:
+                filtered_count += len(workflows)
+                with self.app.batch_update():
+                    # Clear only once data is in, so the table never sits empty
+                    if not cleared:
+                        self.clear()
+                        cleared = True
+                    for workflow in workflows:
+                        workflow_id = str(workflow.id)
+                        if (
+                            workflow_id in self.hidden_rows
+                            or workflow_id in self._last_rows
+                        ):
+                            continue
+                        row_data = self._workflow_to_row(workflow_id, workflow)
+                        try:
+                            self.add_row(*row_data, key=workflow_id)
+                            self._row_inputs[workflow_id] = self._row_inputs_for(
+                                workflow
+                            )
+                        except DuplicateKey:
+                            self.log.debug(
+                                f"Duplicated workflowid when refreshing table: {workflow_id}"
+                            )
+                            return
+        if not cleared:
+            self.clear()
+
+        self._last_filtered_count = filtered_count
         self._last_total_count = total_count
 
         visible_count = len(self.rows)
-        filtered_count = len(workflows)
         hidden_count = len(self.hidden_rows)
         self.post_message(
             self.TableRefreshed(
@@ -278,31 +376,39 @@ class WorkflowTable(DataTable):
             )
         )
 
-    def _workflow_to_row(self, workflow: WorkflowDTO) -> List[TextType]:
-        workflow_id = str(workflow.id)
-        status = StyledStatus(workflow.status)
-        snakefile = Path(workflow.snakefile).name if workflow.snakefile else "N/A"
+    def _workflow_to_row(
+        self, workflow_id: str, workflow: WorkflowDTO
+    ) -> List[TextType]:
+        status = styled_status(workflow.status)
+        snakefile = (
+            os.path.basename(workflow.snakefile) if workflow.snakefile else "N/A"
+        )
         started_at = (
-            workflow.started_at.strftime("%Y-%m-%d %H:%M:%S")
-            if workflow.started_at
-            else "N/A"
+            _format_timestamp(workflow.started_at) if workflow.started_at else "N/A"
         )
-        progress = StyledProgress(workflow.progress)
+        progress = styled_progress(workflow.progress)
         return [workflow_id[-6:], status, snakefile, started_at, progress]
 
-    def _update_row(self, key: str, row_data: List[TextType]) -> None:
-        """Update a single row, adding it if it doesn't exist."""
-        if key not in self.rows:
-            self.add_row(*row_data, key=key)
-        else:
-            existing_row = self.get_row(key)
-            if existing_row != row_data:
-                for col_idx, (new_val, old_val) in enumerate(
-                    zip(row_data, existing_row)
-                ):
-                    if new_val != old_val:
-                        column_key = self._column_keys[col_idx]
-                        self.update_cell(key, column_key, new_val)
+    @staticmethod
+    def _row_inputs_for(workflow: WorkflowDTO) -> tuple:
+        """The workflow fields shown in its row."""
+        return (
+            workflow.status,
+            workflow.snakefile,
+            workflow.started_at,
+            workflow.jobs_finished,
+            workflow.total_job_count,
+        )
+
+    def remove_row(self, row_key: RowKey | str) -> None:
+        super().remove_row(row_key)
+        key = row_key.value if isinstance(row_key, RowKey) else row_key
+        if key is not None:
+            self._row_inputs.pop(key, None)
+
+    def clear(self, columns: bool = False) -> Self:
+        self._row_inputs.clear()
+        return super().clear(columns)
 
     def action_hide_selected(self) -> None:
         """Hide the currently selected workflow."""
@@ -453,64 +559,66 @@ class WorkflowDetailOverview(Container):
             table.show_header = False
             await self.mount(table)
 
-        table.add_row(
-            Text("ID", justify="left", style="bold"),
-            Text(str(workflow.id), justify="left"),
-        )
-        table.add_row(
-            Text("Snakefile", justify="left", style="bold"),
-            Text(
-                workflow.snakefile or "N/A",
-                justify="left",
-                style="dim" if not workflow.snakefile else "",
-            ),
-        )
-        table.add_row(
-            Text("Started At", justify="left", style="bold"),
-            Text(
-                workflow.started_at.strftime("%Y-%m-%d %H:%M:%S")
-                if workflow.started_at
-                else "N/A",
-                justify="left",
-                style="dim" if not workflow.started_at else "",
-            ),
-        )
-        table.add_row(
-            Text("Updated At", justify="left", style="bold"),
-            Text(
-                workflow.updated_at.strftime("%Y-%m-%d %H:%M:%S")
-                if workflow.updated_at
-                else "N/A",
-                justify="left",
-                style="dim" if not workflow.updated_at else "",
-            ),
-        )
-        table.add_row(
-            Text("End Time", justify="left", style="bold"),
-            Text(
-                workflow.end_time.strftime("%Y-%m-%d %H:%M:%S")
-                if workflow.end_time
-                else "N/A",
-                justify="left",
-                style="dim" if not workflow.end_time else "",
-            ),
-        )
-        table.add_row(
-            Text("Status", justify="left", style="bold"),
-            StyledStatus(workflow.status),
-        )
-        table.add_row(
-            Text("Progress", justify="left", style="bold"),
-            StyledProgress(workflow.progress),
-        )
-        table.add_row(
-            Text("Total Jobs", justify="left", style="bold"),
-            Text(str(workflow.total_job_count), justify="left"),
-        )
-        table.add_row(
-            Text("Jobs Finished", justify="left", style="bold"),
-            Text(str(workflow.jobs_finished), justify="left"),
-        )
+        # Repaint once after all rows are in
+        with self.app.batch_update():
+            table.add_row(
+                Text("ID", justify="left", style="bold"),
+                Text(str(workflow.id), justify="left"),
+            )
+            table.add_row(
+                Text("Snakefile", justify="left", style="bold"),
+                Text(
+                    workflow.snakefile or "N/A",
+                    justify="left",
+                    style="dim" if not workflow.snakefile else "",
+                ),
+            )
+            table.add_row(
+                Text("Started At", justify="left", style="bold"),
+                Text(
+                    _format_timestamp(workflow.started_at)
+                    if workflow.started_at
+                    else "N/A",
+                    justify="left",
+                    style="dim" if not workflow.started_at else "",
+                ),
+            )
+            table.add_row(
+                Text("Updated At", justify="left", style="bold"),
+                Text(
+                    _format_timestamp(workflow.updated_at)
+                    if workflow.updated_at
+                    else "N/A",
+                    justify="left",
+                    style="dim" if not workflow.updated_at else "",
+                ),
+            )
+            table.add_row(
+                Text("End Time", justify="left", style="bold"),
+                Text(
+                    _format_timestamp(workflow.end_time)
+                    if workflow.end_time
+                    else "N/A",
+                    justify="left",
+                    style="dim" if not workflow.end_time else "",
+                ),
+            )
+            table.add_row(
+                Text("Status", justify="left", style="bold"),
+                styled_status(workflow.status),
+            )
+            table.add_row(
+                Text("Progress", justify="left", style="bold"),
+                styled_progress(workflow.progress),
+            )
+            table.add_row(
+                Text("Total Jobs", justify="left", style="bold"),
+                Text(str(workflow.total_job_count), justify="left"),
+            )
+            table.add_row(
+                Text("Jobs Finished", justify="left", style="bold"),
+                Text(str(workflow.jobs_finished), justify="left"),
+            )
 
     def _update_table_cells(self, old_data: WorkflowDTO, new_data: WorkflowDTO) -> None:
         """Update individual table cells when workflow data changes."""
@@ -525,7 +633,7 @@ class WorkflowDetailOverview(Container):
                     rows[3],
                     value_column_key,
                     Text(
-                        new_data.updated_at.strftime("%Y-%m-%d %H:%M:%S")
+                        _format_timestamp(new_data.updated_at)
                         if new_data.updated_at
                         else "N/A",
                         justify="left",
@@ -535,12 +643,12 @@ class WorkflowDetailOverview(Container):
 
             if old_data.status != new_data.status and len(rows) > 5:
                 table.update_cell(
-                    rows[5], value_column_key, StyledStatus(new_data.status)
+                    rows[5], value_column_key, styled_status(new_data.status)
                 )
 
             if old_data.progress != new_data.progress and len(rows) > 6:
                 table.update_cell(
-                    rows[6], value_column_key, StyledProgress(new_data.progress)
+                    rows[6], value_column_key, styled_progress(new_data.progress)
                 )
 
             if old_data.total_job_count != new_data.total_job_count and len(rows) > 7:
@@ -607,27 +715,32 @@ class WorkflowErrors(Container):
                 jobs_by_rule[rule_name] = []
             jobs_by_rule[rule_name].append(job)
 
+        collapsibles = []
         for rule_name, jobs in jobs_by_rule.items():
             labels = []
             for job in jobs:
-                job_info = f"Job {str(job.id)}: "
+                job_info = f"Job {job.id}: "
                 logfiles = job.log_files
                 if logfiles:
                     for lf in logfiles:
-                        job_info += str(Path(lf.path))
-                        labels.append(ListItem(Static(job_info), name=str(lf.path)))
+                        labels.append(
+                            ListItem(Static(job_info + lf.path), name=lf.path)
+                        )
                 else:
                     labels.append(ListItem(Static(job_info)))
 
             list_view = ListView(*labels, classes="workflow-errors-listview")
             list_view.styles.height = "auto"
             list_view.styles.max_height = 10
-            collapsible = Collapsible(
-                list_view,
-                title=f"Rule '{rule_name}' ({len(jobs)} failed jobs)",
-                collapsed=True,
+            collapsibles.append(
+                Collapsible(
+                    list_view,
+                    title=f"Rule '{rule_name}' ({len(jobs)} failed jobs)",
+                    collapsed=True,
+                )
             )
-            await self.mount(collapsible)
+        # One mount for all rules, so the container is laid out once
+        await self.mount_all(collapsibles)
 
 
 class ConfirmDeleteModal(ModalScreen[bool]):
@@ -0,0 +1,83 @@
+"""store status and file_type as smallint
+
+Revision ID: 10496c2f280e
+Revises: 016452b9ddc0
+Create Date: 2026-10-15 19:05:33.871245
+
+"""
+
+from typing import Mapping, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "10496c2f280e"
+down_revision: Union[str, None] = "016452b9ddc0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The position of each name is its stored code, as fixed by STATUS_CODES and
+# FILE_TYPE_CODES in snkmt.types.enums
+STATUS_NAMES = ("RUNNING", "SUCCESS", "ERROR", "UNKNOWN")
+FILE_TYPE_NAMES = ("INPUT", "OUTPUT", "LOG", "BENCHMARK")
+
+COLUMNS = (
+    ("workflows", "status", STATUS_NAMES, "status"),
+    ("jobs", "status", STATUS_NAMES, "status"),
+    ("files", "file_type", FILE_TYPE_NAMES, "filetype"),
+)
+
+
+def _recode(table: str, column: str, mapping: Mapping[str, Union[int, str]]) -> None:
+    # Refuse to recode values the mapping doesn't know, rather than letting
+    # the NOT NULL table copy below fail on them halfway through
+    known = ", ".join(f"{old!r}" for old in mapping)
+    unknown: Sequence[object] = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                f"SELECT DISTINCT {column} FROM {table} WHERE {column} NOT IN ({known})"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if unknown:
+        raise ValueError(
+            f"Cannot migrate {table}.{column}: "
+            f"unknown values {sorted(map(str, unknown))}"
+        )
+
+    whens = " ".join(f"WHEN {old!r} THEN {new!r}" for old, new in mapping.items())
+    op.execute(f"UPDATE {table} SET {column} = CASE {column} {whens} ELSE {column} END")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, names, enum_name in COLUMNS:
+        # Codes are written into the text column first; the table copy made
+        # by the type change then stores them as integers
+        _recode(table, column, {name: code for code, name in enumerate(names)})
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Enum(*names, name=enum_name),
+                type_=sa.SmallInteger(),
+                existing_nullable=False,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, names, enum_name in COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.SmallInteger(),
+                type_=sa.Enum(*names, name=enum_name),
+                existing_nullable=False,
+            )
+        # The copy into the text column turned the codes into strings
+        _recode(table, column, {str(code): name for code, name in enumerate(names)})
@@ -1,11 +1,15 @@
 import os
-import shutil
+import sqlite3
 import sys
 import tempfile
+from contextlib import closing
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import Engine, create_engine, event, inspect
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.pool import ConnectionPoolEntry
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from loguru import logger
@@ -13,7 +17,6 @@ from snkmt.core.db.version import (
     DatabaseVersionError,
     get_latest_revision,
     get_database_revision,
-    needs_migration,
     is_database_newer_than_code,
     is_legacy_database,
     stamp_legacy_database,
@@ -23,12 +26,63 @@ from snkmt.core.repository.sql import SQLAlchemyWorkflowRepository
 from snkmt.core.db import SNKMT_DIR
 
 
+def _set_sqlite_pragmas(
+    dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry
+) -> None:
+    """Tune every new SQLite connection for a frequently polled, concurrently written DB."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+def _listen_for_sqlite_connect(engine: Engine) -> None:
+    """Apply the connection pragmas to every new connection of a SQLite engine."""
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+
+
+def _create_sync_engine(db_path: str) -> Engine:
+    """Sync engine for a resolved DB path, owned and disposed by one Database."""
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        echo=False,
+        # The sync engine only serves setup, migrations and the CLI, so a
+        # small pool is enough
+        pool_size=2,
+        max_overflow=2,
+        query_cache_size=1200,
+        future=True,
+    )
+    _listen_for_sqlite_connect(engine)
+    return engine
+
+
 class DatabaseNotFoundError(Exception):
     """Raised when the Snakemake DB file isn’t found and creation is disabled."""
 
     pass
 
 
+@lru_cache(maxsize=32)
+def _resolve_db_path(db_path: Optional[str], cwd: str) -> Path:
+    """Absolute DB file path, the default DB if none is given. Keyed on the
+    working directory as well, since relative paths resolve against it."""
+    return Path(db_path).resolve() if db_path else (SNKMT_DIR / "snkmt.db").resolve()
+
+
+def _ensure_parent(db_file: Path, create: bool) -> None:
+    """Check, or create, the DB's directory."""
+    if not db_file.parent.exists():
+        if create:
+            db_file.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            raise DatabaseNotFoundError(f"No DB directory: {db_file.parent}")
+
+
 class Database:
     """Simple connector for the Snakemake SQLite DB."""
 
@@ -39,34 +93,17 @@ class Database:
         auto_migrate: bool = True,
         ignore_version: bool = False,
     ):
-        default_db_path = SNKMT_DIR / "snkmt.db"
-
-        if db_path:
-            db_file = Path(db_path).resolve()
-        else:
-            db_file = default_db_path.resolve()
-
-        if not db_file.parent.exists():
-            if create_db:
-                db_file.parent.mkdir(parents=True, exist_ok=True)
-            else:
-                raise DatabaseNotFoundError(f"No DB directory: {db_file.parent}")
+        db_file = _resolve_db_path(db_path, os.getcwd())
+        _ensure_parent(db_file, create_db)
 
-        if not db_file.exists() and not create_db:
+        if not create_db and not db_file.exists():
             raise DatabaseNotFoundError(f"DB file not found: {db_file}")
 
         self.db_path = str(db_file)
         self.db_file = db_file  # Keep Path object for config registration
 
         self._register_database()
-        self.engine = create_engine(
-            f"sqlite:///{self.db_path}",
-            echo=False,
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,
-            future=True,
-        )
+        self.engine = _create_sync_engine(self.db_path)
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=True, bind=self.engine
         )
@@ -82,10 +119,13 @@ class Database:
             stamped_revision = stamp_legacy_database(self.session, self.db_path)
             logger.debug(f"Legacy database stamped with revision: {stamped_revision}")
 
-        if auto_migrate and needs_migration(self.session):
-            current_revision = get_database_revision(self.session)
-            latest_revision = get_latest_revision()
+        # Look the revisions up once; each is a query or a scan of the
+        # migration scripts
+        current_revision = get_database_revision(self.session)
+        latest_revision = get_latest_revision()
+        migration_needed = current_revision != latest_revision
 
+        if auto_migrate and migration_needed:
             if is_database_newer_than_code(self.session):
                 raise DatabaseVersionError(
                     f"Database has unknown revision '{current_revision}'. "
@@ -98,14 +138,11 @@ class Database:
             )
 
             create_backup = current_revision is not None
-            self.migrate(create_backup=create_backup)
-        elif not auto_migrate and needs_migration(self.session):
-            if not ignore_version:
-                current_revision = get_database_revision(self.session)
-                latest_revision = get_latest_revision()
-                raise DatabaseVersionError(
-                    f"Database revision {current_revision} needs migration to {latest_revision} but auto_migrate is disabled. Please use snkmt db migrate command."
-                )
+            self.migrate(desired_revision=latest_revision, create_backup=create_backup)
+        elif migration_needed and not ignore_version:
+            raise DatabaseVersionError(
+                f"Database revision {current_revision} needs migration to {latest_revision} but auto_migrate is disabled. Please use snkmt db migrate command."
+            )
 
     def migrate(
         self,
@@ -254,12 +291,13 @@ class Database:
         )
         backup_path = db_path.parent / backup_name
 
-        self.session.close()
-
-        try:
-            shutil.copy2(self.db_path, backup_path)
-        finally:
-            self.session = self.get_session()
+        # The online backup API copies a consistent snapshot, including pages
+        # still in the WAL, without closing our session
+        with (
+            closing(sqlite3.connect(self.db_path)) as src,
+            closing(sqlite3.connect(backup_path)) as dst,
+        ):
+            src.backup(dst)
 
         return str(backup_path)
 
@@ -311,13 +349,20 @@ class AsyncDatabase:
         self.engine = create_async_engine(
             f"sqlite+aiosqlite:///{self._sync_db.db_path}",
             echo=False,
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,
+            # Sized for the dashboard's few concurrent readers; pinging a
+            # local file on checkout buys nothing
+            pool_size=5,
+            max_overflow=5,
+            query_cache_size=1200,
         )
+        _listen_for_sqlite_connect(self.engine.sync_engine)
 
         self.SessionLocal = async_sessionmaker(
-            autocommit=False, autoflush=True, bind=self.engine, class_=AsyncSession
+            autocommit=False,
+            autoflush=True,
+            expire_on_commit=False,
+            bind=self.engine,
+            class_=AsyncSession,
         )
 
     # Delegate all sync operations to the sync database
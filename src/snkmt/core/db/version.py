@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from sqlalchemy import text
@@ -11,16 +12,20 @@ class DatabaseVersionError(Exception):
     pass
 
 
-def get_latest_revision() -> str | None:
-    """Get the latest revision from alembic versions directory."""
+@lru_cache(maxsize=None)
+def _script_directory() -> ScriptDirectory:
+    """The migration scripts shipped with snkmt, loaded once per process."""
     db_dir = Path(__file__).parent
     alembic_config_file = db_dir / "alembic.ini"
     config = Config(alembic_config_file)
     config.set_main_option("script_location", str(db_dir / "alembic"))
-    script = ScriptDirectory.from_config(config)
+    return ScriptDirectory.from_config(config)
+
 
+def get_latest_revision() -> str | None:
+    """Get the latest revision from alembic versions directory."""
     # Get the head revision (latest)
-    return script.get_current_head()
+    return _script_directory().get_current_head()
 
 
 def get_database_revision(session: Session) -> Optional[str]:
@@ -99,11 +104,7 @@ def is_database_newer_than_code(session: Session) -> bool:
 
     # Simple heuristic: if current revision is not in our known revisions,
     # it's likely from a newer version of the code
-    db_dir = Path(__file__).parent
-    alembic_config_file = db_dir / "alembic.ini"
-    config = Config(alembic_config_file)
-    config.set_main_option("script_location", str(db_dir / "alembic"))
-    script = ScriptDirectory.from_config(config)
+    script = _script_directory()
 
     try:
         # Try to get the revision - if it doesn't exist in our migration files,
@@ -1,7 +1,46 @@
+from enum import Enum
+from sqlalchemy import Dialect, SmallInteger
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.types import JSON
-from typing import Any
+from sqlalchemy.types import JSON, TypeDecorator
+from typing import Any, Mapping, Optional, TypeVar
+
+_E = TypeVar("_E", bound=Enum)
+
+# Keep IN lists well below SQLite's bound parameter limit
+IN_CHUNK_SIZE = 500
 
 
 class Base(DeclarativeBase):
     type_annotation_map = {dict[str, Any]: JSON}
+
+
+class SmallIntEnum(TypeDecorator):
+    """Stores an Enum member as the small integer code ``codes`` assigns it,
+    instead of its name.
+
+    Binds accept a member or its value.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[_E], codes: Mapping[_E, int]):
+        super().__init__()
+        # Only enum_class is part of the cache key; the codes are fixed per enum
+        self.enum_class = enum_class
+        self._codes = dict(codes)
+        self._members: dict[int, Enum] = {
+            code: member for member, code in codes.items()
+        }
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(
+        self, value: Optional[int], dialect: Dialect
+    ) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._members[value]
@@ -1,10 +1,10 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Enum
+from sqlalchemy import ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from snkmt.core.models.base import Base
-from snkmt.types.enums import FileType
+from snkmt.core.models.base import Base, SmallIntEnum
+from snkmt.types.enums import FILE_TYPE_CODES, FileType
 
 if TYPE_CHECKING:
     from snkmt.core.models.job import Job
@@ -14,6 +14,6 @@ class File(Base):
     __tablename__ = "files"
     id: Mapped[int] = mapped_column(primary_key=True)
     path: Mapped[str]  # TODO: use pathlib.Path/os.pathlike type here eventually
-    file_type: Mapped[FileType] = mapped_column(Enum(FileType))
+    file_type: Mapped[FileType] = mapped_column(SmallIntEnum(FileType, FILE_TYPE_CODES))
     job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id"))
     job: Mapped["Job"] = relationship("Job", back_populates="files")
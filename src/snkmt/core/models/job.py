@@ -2,11 +2,11 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import ForeignKey, Enum
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 
-from snkmt.core.models.base import Base
-from snkmt.types.enums import Status
+from snkmt.core.models.base import Base, SmallIntEnum
+from snkmt.types.enums import STATUS_CODES, Status
 
 if TYPE_CHECKING:
     from snkmt.core.models.file import File
@@ -39,6 +39,13 @@ class Job(Base):
     """
 
     __tablename__ = "jobs"
+    # ix_jobs_rule_status covers the per-rule status counts, which group by
+    # (rule_id, status), and any lookup by rule_id alone. ix_jobs_wf_id serves
+    # the per-workflow job listing.
+    __table_args__ = (
+        Index("ix_jobs_rule_status", "rule_id", "status"),
+        Index("ix_jobs_wf_id", "workflow_id"),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     snakemake_id: Mapped[int]
     workflow_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("workflows.id"))
@@ -50,7 +57,9 @@ class Job(Base):
     shellcmd: Mapped[Optional[str]]
     threads: Mapped[int]
     priority: Mapped[Optional[int]]
-    status: Mapped[Status] = mapped_column(Enum(Status), default="UNKNOWN")
+    status: Mapped[Status] = mapped_column(
+        SmallIntEnum(Status, STATUS_CODES), default=Status.UNKNOWN
+    )
     started_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(timezone.utc)
     )
@@ -1,11 +1,20 @@
 import uuid
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
-from sqlalchemy import ForeignKey, select, func, case
+from sqlalchemy import (
+    Computed,
+    ForeignKey,
+    Index,
+    SQLColumnExpression,
+    select,
+    func,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 from datetime import datetime, timezone
 
-from snkmt.core.models.base import Base
+from snkmt.core.models.base import Base, IN_CHUNK_SIZE
+from snkmt.types.enums import Status
 
 if TYPE_CHECKING:
     from snkmt.core.models.job import Job
@@ -15,6 +24,8 @@ if TYPE_CHECKING:
 
 class Rule(Base):
     __tablename__ = "rules"
+    # Serves the per-workflow rule listing, filtered and ordered by updated_at
+    __table_args__ = (Index("ix_rules_wf_updated", "workflow_id", "updated_at"),)
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str]
     workflow_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("workflows.id"))
@@ -25,6 +36,16 @@ class Rule(Base):
     workflow: Mapped["Workflow"] = relationship("Workflow", back_populates="rules")
     total_job_count: Mapped[int] = mapped_column(default=0)  # from run info
     jobs_finished: Mapped[int] = mapped_column(default=0)
+    # Computed by SQLite on read (VIRTUAL), so rules can be sorted and
+    # filtered by progress in SQL; 0.0 when the job count isn't known yet.
+    # Read through the progress hybrid below.
+    _progress: Mapped[float] = mapped_column(
+        "progress",
+        Computed(
+            "COALESCE(CAST(jobs_finished AS REAL) / NULLIF(total_job_count, 0), 0.0)",
+            persisted=False,
+        ),
+    )
     jobs: Mapped[list["Job"]] = relationship(
         "Job", back_populates="rule", cascade="all, delete-orphan"
     )
@@ -32,11 +53,18 @@ class Rule(Base):
         "Error", back_populates="rule", cascade="all, delete-orphan"
     )
 
-    @property
+    @hybrid_property
     def progress(self) -> float:
-        if self.total_job_count == 0:
+        # Computed in Python on instances, so it is also right for new or
+        # modified rules the database hasn't recomputed yet
+        if not self.total_job_count:
             return 0.0
-        return self.jobs_finished / self.total_job_count
+        return (self.jobs_finished or 0) / self.total_job_count
+
+    @progress.inplace.expression
+    @classmethod
+    def _progress_expression(cls) -> SQLColumnExpression[float]:
+        return cls._progress
 
     @classmethod
     def get_updated_since(
@@ -47,35 +75,68 @@ class Rule(Base):
         limit: Optional[int] = None,
     ):
         """Get rules for a workflow that have been updated since the given timestamp."""
-        query = session.query(cls).filter(
+        query = select(cls).where(
             cls.workflow_id == workflow_id, cls.updated_at >= timestamp
         )
         if limit:
             query = query.limit(limit)
-        return query.all()
+        return list(session.scalars(query))
 
-    def get_job_counts(self, session):
-        """Get all job counts in a single efficient query."""
+    @classmethod
+    def get_job_counts_bulk(
+        cls, session: Session, rule_ids: Sequence[int]
+    ) -> dict[int, dict[Status, int]]:
+        """
+        Get job counts by status for many rules in a single grouped query.
+
+        Every requested rule gets an entry for every status, defaulting to 0.
+        Rule ids are sent in chunks, one grouped query per chunk.
+        """
+        from snkmt.core.models.job import Job
+
+        counts = {rule_id: dict.fromkeys(Status, 0) for rule_id in rule_ids}
+        ids = list(counts)
+        for start in range(0, len(ids), IN_CHUNK_SIZE):
+            chunk = ids[start : start + IN_CHUNK_SIZE]
+            result = session.execute(
+                select(Job.rule_id, Job.status, func.count(Job.id))
+                .where(Job.rule_id.in_(chunk))
+                .group_by(Job.rule_id, Job.status)
+            )
+            for rule_id, status, count in result:
+                counts[rule_id][status] = count
+        return counts
+
+    @classmethod
+    def job_counts_for_workflow(
+        cls, session: Session, workflow_id: uuid.UUID
+    ) -> dict[int, dict[Status, int]]:
+        """
+        Get job counts by status for every rule of a workflow in a single grouped query.
+
+        Rules without any jobs are absent from the result.
+        """
         from snkmt.core.models.job import Job
-        from snkmt.types.enums import Status
 
+        counts: dict[int, dict[Status, int]] = {}
         result = session.execute(
-            select(
-                func.sum(case((Job.status == Status.RUNNING, 1), else_=0)).label(
-                    "running"
-                ),
-                func.sum(case((Job.status == Status.ERROR, 1), else_=0)).label(
-                    "failed"
-                ),
-                func.sum(case((Job.status == Status.SUCCESS, 1), else_=0)).label(
-                    "success"
-                ),
-            ).where(Job.rule_id == self.id)
-        ).one()
-
-        running = result.running or 0
-        failed = result.failed or 0
-        success = result.success or 0
+            select(Job.rule_id, Job.status, func.count(Job.id))
+            .join(cls, Job.rule_id == cls.id)
+            .where(cls.workflow_id == workflow_id)
+            .group_by(Job.rule_id, Job.status)
+        )
+        for rule_id, status, count in result:
+            if rule_id not in counts:
+                counts[rule_id] = dict.fromkeys(Status, 0)
+            counts[rule_id][status] = count
+        return counts
+
+    def get_job_counts(self, session):
+        """Get all job counts in a single efficient query."""
+        counts = self.get_job_counts_bulk(session, [self.id])[self.id]
+        running = counts[Status.RUNNING]
+        failed = counts[Status.ERROR]
+        success = counts[Status.SUCCESS]
 
         # i dont think pending jobs are logged
         pending = self.total_job_count - running - failed - success
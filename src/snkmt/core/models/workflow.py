@@ -1,7 +1,7 @@
-from snkmt.core.models.base import Base
-from snkmt.types.enums import Status
+from snkmt.core.models.base import Base, SmallIntEnum
+from snkmt.types.enums import STATUS_CODES, Status
 
-from sqlalchemy import JSON, Enum, select, func
+from sqlalchemy import JSON, select, func, case
 from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, TYPE_CHECKING, List
@@ -23,9 +23,12 @@ class Workflow(Base):
     updated_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
+        index=True,
     )
     end_time: Mapped[Optional[datetime]]
-    status: Mapped[Status] = mapped_column(Enum(Status), default="UNKNOWN")
+    status: Mapped[Status] = mapped_column(
+        SmallIntEnum(Status, STATUS_CODES), default=Status.UNKNOWN, index=True
+    )
     command_line: Mapped[Optional[str]]
     dryrun: Mapped[bool]
     rulegraph_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(
@@ -56,10 +59,10 @@ class Workflow(Base):
         cls, session: Session, timestamp, limit: Optional[int] = None
     ):
         """Get workflows that have been updated since the given timestamp."""
-        query = session.query(cls).filter(cls.updated_at >= timestamp)
+        query = select(cls).where(cls.updated_at >= timestamp)
         if limit:
             query = query.limit(limit)
-        return query.all()
+        return list(session.scalars(query))
 
     @property
     def progress(self) -> float:
@@ -114,16 +117,25 @@ class Workflow(Base):
         """
         Returns a dictionary with counts of workflows by status:
         running, success, and failed.
+
+        All counts come from a single scan of the workflows table.
         """
-        status_map = {
-            "running": [Status.RUNNING],
-            "success": [Status.SUCCESS],
-            "failed": [Status.ERROR],
+        result = session.execute(
+            select(
+                func.sum(case((cls.status == Status.RUNNING, 1), else_=0)).label(
+                    "running"
+                ),
+                func.sum(case((cls.status == Status.SUCCESS, 1), else_=0)).label(
+                    "success"
+                ),
+                func.sum(case((cls.status == Status.ERROR, 1), else_=0)).label(
+                    "failed"
+                ),
+            )
+        ).one()
+
+        return {
+            "running": result.running or 0,
+            "success": result.success or 0,
+            "failed": result.failed or 0,
         }
-        counts = {key: 0 for key in status_map}
-        query = session.query(cls.status, func.count(cls.id)).group_by(cls.status)
-        for status, count in query:
-            for key, statuses in status_map.items():
-                if status in statuses:
-                    counts[key] += count
-        return counts
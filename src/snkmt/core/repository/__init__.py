@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union
+from typing import AsyncContextManager, AsyncGenerator, Optional, List, Union
 from datetime import datetime
 from uuid import UUID
 from snkmt.types.dto import (
@@ -13,15 +13,31 @@ from snkmt.types.dto import (
     CreateJobDTO,
     UpdateRuleDTO,
     UpdateJobDTO,
+    WorkflowTreeDTO,
 )
 from snkmt.types.enums import Status, DateFilter
 
 
 class WorkflowRepository(ABC):
+    @abstractmethod
+    def transaction(self) -> AsyncContextManager[None]:
+        """Run every repository call made inside the block in one transaction,
+        committed when the block exits and rolled back if it raises. Nested
+        blocks join the outer one. Not for sharing across concurrent tasks."""
+        pass
+
     @abstractmethod
     async def get(self, workflow_id: UUID) -> Optional[WorkflowDTO]:
         pass
 
+    @abstractmethod
+    async def get_workflow_tree(
+        self, workflow_id: UUID, status: Optional[Status] = None
+    ) -> Optional[WorkflowTreeDTO]:
+        """Workflow with its rules, jobs and files. With a status, only jobs in
+        that status and the rules that have any are included"""
+        pass
+
     @abstractmethod
     async def delete(self, workflow_id: UUID) -> bool:
         """Delete a single workflow and all related data"""
@@ -51,6 +67,22 @@ class WorkflowRepository(ABC):
         """List workflows for dashboard table"""
         pass
 
+    @abstractmethod
+    def list_batches(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order_by: str = "started_at",
+        descending: bool = True,
+        since: Optional[datetime] = None,
+        name: Optional[str] = None,
+        status: Optional[Union[str, Status]] = None,
+        started_at: Optional[DateFilter] = None,
+        batch_size: int = 200,
+    ) -> AsyncGenerator[List[WorkflowDTO], None]:
+        """Like list, but streamed in batches of at most batch_size workflows"""
+        pass
+
     @abstractmethod
     async def count(
         self,
@@ -61,6 +93,16 @@ class WorkflowRepository(ABC):
         """Count workflows matching the given filters"""
         pass
 
+    @abstractmethod
+    async def last_updated_at(self) -> Optional[datetime]:
+        """Most recent update time across all workflows, None if there are none"""
+        pass
+
+    @abstractmethod
+    async def last_rule_updated_at(self, workflow_id: UUID) -> Optional[datetime]:
+        """Most recent update time across a workflow's rules, None if it has none"""
+        pass
+
     @abstractmethod
     async def list_rules(
         self,
@@ -102,6 +144,17 @@ class WorkflowRepository(ABC):
     ) -> Optional[JobDTO]:
         pass
 
+    @abstractmethod
+    async def create_jobs_bulk(
+        self,
+        workflow_id: UUID,
+        rule_id: int,
+        jobs: List[CreateJobDTO],
+    ) -> Optional[List[JobDTO]]:
+        """Insert many jobs of one rule at once, returning them in the given
+        order, or None if the rule isn't part of the workflow"""
+        pass
+
     @abstractmethod
     async def get_job(
         self,
@@ -128,6 +181,17 @@ class WorkflowRepository(ABC):
     ) -> Optional[FileDTO]:
         pass
 
+    @abstractmethod
+    async def create_files_bulk(
+        self,
+        workflow_id: UUID,
+        job_id: int,
+        files: List[CreateFileDTO],
+    ) -> Optional[List[FileDTO]]:
+        """Insert many files of one job at once, returning them in the given
+        order, or None if the job isn't part of the workflow"""
+        pass
+
     @abstractmethod
     async def list_jobs(
         self,
@@ -1,11 +1,40 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlalchemy import select, and_, func, case
-from sqlalchemy.orm import selectinload
-from typing import Optional, List, Union
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import (
+    CursorResult,
+    Row,
+    select,
+    insert,
+    update as sql_update,
+    and_,
+    bindparam,
+    func,
+    lambda_stmt,
+    literal,
+)
+from sqlalchemy.sql import ColumnElement, Executable
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Optional,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 from datetime import datetime, timezone, timedelta
 from uuid import UUID
 
 from snkmt.core.models import Workflow, Rule, Job, File
+from snkmt.core.models.base import Base, IN_CHUNK_SIZE
 from snkmt.types.enums import Status, DateFilter
 from snkmt.core.repository import WorkflowRepository
 from snkmt.types.dto import (
@@ -20,6 +49,73 @@ from snkmt.types.dto import (
     UpdateJobDTO,
     UpdateRuleDTO,
     FileDTO,
+    WorkflowTreeDTO,
+)
+
+# Polled every refresh tick, so build it once
+_LAST_UPDATED_AT = select(func.max(Workflow.updated_at))
+
+# Columns needed for a WorkflowDTO, selected as plain rows on the refresh path
+_WORKFLOW_DTO_COLUMNS = (
+    Workflow.id,
+    Workflow.status,
+    Workflow.snakefile,
+    Workflow.total_job_count,
+    Workflow.jobs_finished,
+    Workflow.started_at,
+    Workflow.updated_at,
+    Workflow.end_time,
+    Workflow.dryrun,
+)
+
+# Columns needed for a RuleDTO
+_RULE_DTO_COLUMNS = (
+    Rule.id,
+    Rule.name,
+    Rule.workflow_id,
+    Rule.total_job_count,
+    Rule.jobs_finished,
+    Rule.updated_at,
+)
+
+# Fetched whenever a workflow is opened. Only the rule ids are needed, and
+# any other relationship access raises instead of lazy loading, which
+# can't run implicitly under asyncio anyway.
+_WORKFLOW_BY_ID = (
+    select(Workflow)
+    .options(selectinload(Workflow.rules).load_only(Rule.id), raiseload("*"))
+    .where(Workflow.id == bindparam("workflow_id"))
+)
+
+# Fetched whenever a job is opened; the job's files are part of its DTO
+_JOB_BY_ID = (
+    select(Job)
+    .options(selectinload(Job.files))
+    .where(Job.id == bindparam("job_id"), Job.workflow_id == bindparam("workflow_id"))
+)
+
+
+def _insert_from_parent(
+    model: type[Base], values: Dict[str, Any], *parent_criteria: ColumnElement[bool]
+) -> Insert:
+    """INSERT ... SELECT that only writes a row when the parent row matching
+    ``parent_criteria`` exists, so the ownership check and the insert are one
+    statement. Add ``.returning()``; no row back means the parent didn't match.
+    """
+    columns = model.__table__.c
+    source = select(
+        *(literal(value, columns[name].type) for name, value in values.items())
+    ).where(*parent_criteria)
+    return insert(model).from_select(list(values), source)
+
+
+# Rows buffered per fetch when streaming unpaginated job listings.
+_STREAM_YIELD_PER = 1000
+
+# Session factory and session of the transaction() block the current task
+# is in. Repositories built on the same factory join it.
+_transaction: ContextVar[Optional[Tuple[async_sessionmaker, AsyncSession]]] = (
+    ContextVar("snkmt_transaction", default=None)
 )
 
 
@@ -27,25 +123,100 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
     def __init__(self, session_factory: async_sessionmaker):
         self.async_session = session_factory
 
-    async def get(self, workflow_id: UUID) -> Optional[WorkflowDTO]:
+    def _transaction_session(self) -> Optional[AsyncSession]:
+        """Session of the enclosing transaction() block, if it was opened on
+        this repository's session factory."""
+        current = _transaction.get()
+        if current is None or current[0] is not self.async_session:
+            return None
+        return current[1]
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        # Nested blocks join the outer transaction
+        if self._transaction_session() is not None:
+            yield
+            return
+
+        async with self.async_session() as session, session.begin():
+            token = _transaction.set((self.async_session, session))
+            try:
+                yield
+            finally:
+                _transaction.reset(token)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """The enclosing transaction's session, or a fresh one for this call."""
+        session = self._transaction_session()
+        if session is not None:
+            yield session
+            return
+
         async with self.async_session() as session:
+            yield session
+
+    async def _commit(self, session: AsyncSession) -> None:
+        # Inside transaction() the block commits once at the end; flushing
+        # lets later calls in the block see this write
+        if session is self._transaction_session():
+            await session.flush()
+        else:
+            await session.commit()
+
+    async def get(self, workflow_id: UUID) -> Optional[WorkflowDTO]:
+        async with self._session() as session:
             result = await session.execute(
-                select(Workflow).where(Workflow.id == workflow_id)
+                _WORKFLOW_BY_ID, {"workflow_id": workflow_id}
             )
             workflow = result.scalar_one_or_none()
             return self._workflow_to_dto(workflow) if workflow else None
 
+    async def get_workflow_tree(
+        self, workflow_id: UUID, status: Optional[Status] = None
+    ) -> Optional[WorkflowTreeDTO]:
+        jobs = Rule.jobs if status is None else Rule.jobs.and_(Job.status == status)
+        # One IN-list SELECT per level (rules, jobs, files), however big the tree
+        stmt = (
+            select(Workflow)
+            .options(
+                selectinload(Workflow.rules).selectinload(jobs).selectinload(Job.files),
+                raiseload("*"),
+            )
+            .where(Workflow.id == workflow_id)
+        )
+        async with self._session() as session:
+            workflow = await session.scalar(stmt)
+            if not workflow:
+                return None
+
+            counts_by_rule = await session.run_sync(
+                Rule.job_counts_for_workflow, workflow_id
+            )
+            no_jobs = dict.fromkeys(Status, 0)
+
+            tree = WorkflowTreeDTO(workflow=self._workflow_to_dto(workflow))
+            for rule in workflow.rules:
+                if status is not None and not rule.jobs:
+                    continue
+                job_counts = self._job_counts(
+                    rule, counts_by_rule.get(rule.id, no_jobs)
+                )
+                tree.rules.append(self._rule_to_dto(rule, job_counts))
+                tree.jobs_by_rule[rule.id] = list(map(self._job_to_dto, rule.jobs))
+            return tree
+
     async def delete(self, workflow_id: UUID) -> bool:
-        async with self.async_session() as session:
+        async with self._session() as session:
             workflow = await session.get(Workflow, workflow_id)
             if workflow:
                 await session.delete(workflow)
-                await session.commit()
+                await self._commit(session)
                 return True
             return False
 
     async def create(self, workflow: WorkflowDTO) -> Optional[UUID]:
-        async with self.async_session() as session:
+        async with self._session() as session:
             new_workflow = Workflow(
                 id=workflow.id,
                 snakefile=workflow.snakefile,
@@ -57,25 +228,39 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
                 dryrun=workflow.dryrun,
             )
             session.add(new_workflow)
-            await session.commit()
+            await self._commit(session)
             return new_workflow.id
 
     async def update(self, update: UpdateWorkflowDTO) -> bool:
-        async with self.async_session() as session:
-            workflow = await session.get(Workflow, update.id)
-            if not workflow:
+        values: Dict[str, Any] = {}
+        if update.status is not None:
+            values["status"] = update.status
+        if update.total_job_count is not None:
+            values["total_job_count"] = update.total_job_count
+        if update.jobs_finished is not None:
+            values["jobs_finished"] = update.jobs_finished
+        if update.end_time is not None:
+            values["end_time"] = update.end_time
+
+        async with self._session() as session:
+            if not values:
+                found = await session.scalar(
+                    select(Workflow.id).where(Workflow.id == update.id)
+                )
+                return found is not None
+
+            # One UPDATE, no SELECT of the current row first
+            result = cast(
+                CursorResult,
+                await session.execute(
+                    sql_update(Workflow)
+                    .where(Workflow.id == update.id)
+                    .values(**values)
+                ),
+            )
+            if result.rowcount == 0:
                 return False
-
-            if update.status is not None:
-                workflow.status = update.status
-            if update.total_job_count is not None:
-                workflow.total_job_count = update.total_job_count
-            if update.jobs_finished is not None:
-                workflow.jobs_finished = update.jobs_finished
-            if update.end_time is not None:
-                workflow.end_time = update.end_time
-
-            await session.commit()
+            await self._commit(session)
             return True
 
     async def list(
@@ -89,36 +274,99 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
         status: Optional[Union[str, Status]] = None,
         started_at: Optional[DateFilter] = None,
     ) -> List[WorkflowDTO]:
-        async with self.async_session() as session:
-            stmt = select(Workflow)
-
-            if since:
-                stmt = stmt.where(Workflow.updated_at >= since)
-
-            if name:
-                stmt = stmt.where(Workflow.snakefile.ilike(f"%{name}%"))
-
-            if status and status != "all":
-                if isinstance(status, str):
-                    status = Status(status.upper())
-                stmt = stmt.where(Workflow.status == status)
-
-            if started_at and started_at != DateFilter.ANY:
-                date_condition = self._get_date_condition(started_at)
-                if date_condition is not None:
-                    stmt = stmt.where(date_condition)
-
-            order_column = getattr(Workflow, order_by, Workflow.started_at)
-            stmt = stmt.order_by(order_column.desc() if descending else order_column)
+        stmt = self._list_statement(
+            limit, offset, order_by, descending, since, name, status, started_at
+        )
+        async with self._session() as session:
+            result = await session.execute(stmt)
+            return await self._rows_to_workflow_dtos(session, result.all())
 
-            if limit:
-                stmt = stmt.limit(limit)
-            if offset:
-                stmt = stmt.offset(offset)
+    async def list_batches(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order_by: str = "started_at",
+        descending: bool = True,
+        since: Optional[datetime] = None,
+        name: Optional[str] = None,
+        status: Optional[Union[str, Status]] = None,
+        started_at: Optional[DateFilter] = None,
+        batch_size: int = 200,
+    ) -> AsyncGenerator[List[WorkflowDTO], None]:
+        stmt = self._list_statement(
+            limit, offset, order_by, descending, since, name, status, started_at
+        )
+        async with self._session() as session:
+            result = await session.stream(
+                stmt, execution_options={"yield_per": batch_size}
+            )
+            async for rows in result.partitions():
+                yield await self._rows_to_workflow_dtos(session, rows)
 
-            result = await session.execute(stmt)
-            workflows = result.scalars().all()
-            return [self._workflow_to_dto(w) for w in workflows]
+    def _list_statement(
+        self,
+        limit: Optional[int],
+        offset: int,
+        order_by: str,
+        descending: bool,
+        since: Optional[datetime],
+        name: Optional[str],
+        status: Optional[Union[str, Status]],
+        started_at: Optional[DateFilter],
+    ) -> StatementLambdaElement:
+        # Lambda statements are cached by the code locations of their
+        # lambdas, so the refresh query is only built once per filter combo
+        stmt = lambda_stmt(lambda: select(*_WORKFLOW_DTO_COLUMNS))
+
+        if since:
+            stmt += lambda s: s.where(Workflow.updated_at >= since)
+
+        if name:
+            pattern = f"%{name}%"
+            stmt += lambda s: s.where(Workflow.snakefile.ilike(pattern))
+
+        if status and status != "all":
+            if isinstance(status, str):
+                status = Status(status.upper())
+            stmt += lambda s: s.where(Workflow.status == status)
+
+        if started_at and started_at != DateFilter.ANY:
+            date_condition = self._get_date_condition(started_at)
+            if date_condition is not None:
+                stmt += lambda s: s.where(date_condition)
+
+        order_column = getattr(Workflow, order_by, Workflow.started_at)
+        ordering = order_column.desc() if descending else order_column
+        stmt += lambda s: s.order_by(ordering)
+
+        if limit:
+            stmt += lambda s: s.limit(limit)
+        if offset:
+            stmt += lambda s: s.offset(offset)
+        return stmt
+
+    async def _rows_to_workflow_dtos(
+        self, session: AsyncSession, rows: Sequence[Row]
+    ) -> List[WorkflowDTO]:
+        # Plain rows skip ORM instance construction and the selectin loads
+        # of rules and errors, only the rule ids are fetched separately
+        rule_ids = await self._rule_ids_by_workflow(session, [row.id for row in rows])
+        return [self._workflow_to_dto(row, rule_ids.get(row.id, [])) for row in rows]
+
+    async def _rule_ids_by_workflow(
+        self, session: AsyncSession, workflow_ids: List[UUID]
+    ) -> dict[UUID, List[int]]:
+        rule_ids: dict[UUID, List[int]] = {}
+        for start in range(0, len(workflow_ids), IN_CHUNK_SIZE):
+            chunk = workflow_ids[start : start + IN_CHUNK_SIZE]
+            result = await session.execute(
+                select(Rule.workflow_id, Rule.id)
+                .where(Rule.workflow_id.in_(chunk))
+                .order_by(Rule.id)
+            )
+            for workflow_id, rule_id in result:
+                rule_ids.setdefault(workflow_id, []).append(rule_id)
+        return rule_ids
 
     async def count(
         self,
@@ -126,7 +374,7 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
         status: Optional[Union[str, Status]] = None,
         started_at: Optional[DateFilter] = None,
     ) -> int:
-        async with self.async_session() as session:
+        async with self._session() as session:
             stmt = select(func.count(Workflow.id))
 
             if name:
@@ -145,6 +393,18 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
             result = await session.execute(stmt)
             return result.scalar() or 0
 
+    async def last_updated_at(self) -> Optional[datetime]:
+        async with self._session() as session:
+            result = await session.execute(_LAST_UPDATED_AT)
+            return result.scalar()
+
+    async def last_rule_updated_at(self, workflow_id: UUID) -> Optional[datetime]:
+        async with self._session() as session:
+            result = await session.execute(
+                select(func.max(Rule.updated_at)).where(Rule.workflow_id == workflow_id)
+            )
+            return result.scalar()
+
     def _get_date_condition(self, date_filter: DateFilter):
         """Convert DateFilter to SQLAlchemy condition."""
         now = datetime.now(timezone.utc)
@@ -199,206 +459,319 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
         descending: bool = True,
         since: Optional[datetime] = None,
     ) -> List[RuleDTO]:
-        async with self.async_session() as session:
-            stmt = select(Rule).where(Rule.workflow_id == workflow_id)
+        stmt = self._list_rules_statement(
+            workflow_id, status, limit, offset, order_by, descending, since
+        )
+        async with self._session() as session:
+            # Plain rows, the rule table only needs the DTO columns
+            result = await session.execute(stmt)
+            rules = result.all()
 
-            if since:
-                stmt = stmt.where(Rule.updated_at >= since)
+            if not rules:
+                return []
 
-            # Filter by status requires joining with jobs
-            if status:
-                stmt = stmt.join(Job).where(Job.status == status).distinct()
+            if since or status or limit or offset:
+                counts_by_rule = await session.run_sync(
+                    Rule.get_job_counts_bulk, [r.id for r in rules]
+                )
+            else:
+                # Every rule of the workflow is listed, so group by workflow
+                # instead of sending all rule ids back in an IN list
+                counts_by_rule = await session.run_sync(
+                    Rule.job_counts_for_workflow, workflow_id
+                )
+            no_jobs = dict.fromkeys(Status, 0)
 
-            order_column = getattr(Rule, order_by, Rule.updated_at)
-            stmt = stmt.order_by(order_column.desc() if descending else order_column)
+            return [
+                self._rule_to_dto(
+                    rule,
+                    self._job_counts(rule, counts_by_rule.get(rule.id, no_jobs)),
+                )
+                for rule in rules
+            ]
 
-            if limit:
-                stmt = stmt.limit(limit)
-            if offset:
-                stmt = stmt.offset(offset)
+    def _list_rules_statement(
+        self,
+        workflow_id: UUID,
+        status: Optional[Status],
+        limit: Optional[int],
+        offset: int,
+        order_by: str,
+        descending: bool,
+        since: Optional[datetime],
+    ) -> StatementLambdaElement:
+        # Polled on every rule table refresh; see _list_statement
+        stmt = lambda_stmt(
+            lambda: select(*_RULE_DTO_COLUMNS).where(Rule.workflow_id == workflow_id)
+        )
 
-            result = await session.execute(stmt)
-            rules = result.scalars().all()
-
-            if rules:
-                rule_ids = [r.id for r in rules]
-                counts_result = await session.execute(
-                    select(
-                        Job.rule_id,
-                        func.sum(
-                            case((Job.status == Status.RUNNING, 1), else_=0)
-                        ).label("running"),
-                        func.sum(case((Job.status == Status.ERROR, 1), else_=0)).label(
-                            "failed"
-                        ),
-                        func.sum(
-                            case((Job.status == Status.SUCCESS, 1), else_=0)
-                        ).label("success"),
-                    )
-                    .where(Job.rule_id.in_(rule_ids))
-                    .group_by(Job.rule_id)
-                )
+        if since:
+            stmt += lambda s: s.where(Rule.updated_at >= since)
+
+        # EXISTS stops at the first matching job and, unlike a join, needs
+        # no DISTINCT pass; it is answered from ix_jobs_rule_status
+        if status:
+            stmt += lambda s: s.where(
+                select(Job.id)
+                .where(and_(Job.rule_id == Rule.id, Job.status == status))
+                .exists()
+            )
+
+        order_column = getattr(Rule, order_by, Rule.updated_at)
+        ordering = order_column.desc() if descending else order_column
+        stmt += lambda s: s.order_by(ordering)
 
-                counts_by_rule = {}
-                for row in counts_result:
-                    counts_by_rule[row.rule_id] = {
-                        "running": row.running or 0,
-                        "failed": row.failed or 0,
-                        "success": row.success or 0,
-                    }
-
-                dtos = []
-                for rule in rules:
-                    job_counts_dict = counts_by_rule.get(
-                        rule.id, {"running": 0, "failed": 0, "success": 0}
-                    )
-                    pending = rule.total_job_count - sum(job_counts_dict.values())
-                    job_counts_dict["pending"] = pending
-                    job_counts_dict["total"] = rule.total_job_count
-                    job_counts = JobCounts(**job_counts_dict)
-                    dtos.append(self._rule_to_dto(rule, job_counts))
-                return dtos
-
-            return []
+        if limit:
+            stmt += lambda s: s.limit(limit)
+        if offset:
+            stmt += lambda s: s.offset(offset)
+        return stmt
 
     async def list_rule_jobs(self, workflow_id: UUID, rule_id: int) -> List[JobDTO]:
-        async with self.async_session() as session:
+        async with self._session() as session:
             stmt = (
                 select(Job)
+                .options(selectinload(Job.files))
                 .join(Rule)
                 .where(and_(Rule.workflow_id == workflow_id, Job.rule_id == rule_id))
+                .execution_options(yield_per=_STREAM_YIELD_PER)
             )
-            result = await session.execute(stmt)
-            jobs = result.scalars().all()
-            return [self._job_to_dto(j) for j in jobs]
+            result = await session.stream_scalars(stmt)
+            return [self._job_to_dto(j) async for j in result]
 
     async def create_rule(
         self, workflow_id: UUID, rule: CreateRuleDTO
     ) -> Optional[int]:
-        async with self.async_session() as session:
-            # Check workflow exists
-            wf_exists = await session.get(Workflow, workflow_id)
-            if not wf_exists:
-                return None
-
-            new_rule = Rule(
-                name=rule.name,
-                workflow_id=workflow_id,
-                total_job_count=rule.total_job_count,
+        async with self._session() as session:
+            # Only inserts if the workflow exists
+            result = await session.execute(
+                _insert_from_parent(
+                    Rule,
+                    {
+                        "name": rule.name,
+                        "workflow_id": workflow_id,
+                        "total_job_count": rule.total_job_count,
+                    },
+                    Workflow.id == workflow_id,
+                ).returning(Rule.id)
             )
-            session.add(new_rule)
-            await session.commit()
-            await session.refresh(new_rule)
-            return new_rule.id
+            rule_id = result.scalar_one_or_none()
+            if rule_id is None:
+                return None
+            await self._commit(session)
+            return rule_id
 
     async def update_rule(
         self, workflow_id: UUID, rule_id: int, update: UpdateRuleDTO
     ) -> Optional[int]:
-        async with self.async_session() as session:
-            stmt = select(Rule).where(
-                and_(Rule.id == rule_id, Rule.workflow_id == workflow_id)
+        values: Dict[str, Any] = {}
+        if update.total_job_count is not None:
+            values["total_job_count"] = update.total_job_count
+        if update.jobs_finished is not None:
+            values["jobs_finished"] = update.jobs_finished
+
+        criteria = and_(Rule.id == rule_id, Rule.workflow_id == workflow_id)
+        async with self._session() as session:
+            if not values:
+                found = await session.scalar(select(Rule.id).where(criteria))
+                return None if found is None else rule_id
+
+            # The WHERE clause doubles as the ownership check
+            result = cast(
+                CursorResult,
+                await session.execute(
+                    sql_update(Rule).where(criteria).values(**values)
+                ),
             )
-            result = await session.execute(stmt)
-            rule = result.scalar_one_or_none()
-
-            if not rule:
+            if result.rowcount == 0:
                 return None
-
-            if update.total_job_count is not None:
-                rule.total_job_count = update.total_job_count
-            if update.jobs_finished is not None:
-                rule.jobs_finished = update.jobs_finished
-
-            await session.commit()
-            await session.refresh(rule)
+            await self._commit(session)
             return rule_id
 
     async def create_job(
         self, workflow_id: UUID, rule_id: int, job: CreateJobDTO
     ) -> Optional[JobDTO]:
-        async with self.async_session() as session:
+        async with self._session() as session:
+            # Only inserts if the rule belongs to the workflow. RETURNING hands
+            # back the new id
+            result = await session.execute(
+                _insert_from_parent(
+                    Job,
+                    self._job_values(workflow_id, rule_id, job),
+                    Rule.id == rule_id,
+                    Rule.workflow_id == workflow_id,
+                ).returning(Job.id)
+            )
+            job_id = result.scalar_one_or_none()
+            if job_id is None:
+                return None
+            await self._commit(session)
+            return self._new_job_dto(job_id, workflow_id, rule_id, job)
+
+    def _job_values(
+        self, workflow_id: UUID, rule_id: int, job: CreateJobDTO
+    ) -> Dict[str, Any]:
+        return {
+            "snakemake_id": job.snakemake_id,
+            "workflow_id": workflow_id,
+            "rule_id": rule_id,
+            "status": job.status,
+            "threads": job.threads,
+            "started_at": job.started_at,
+            "message": job.message,
+            "wildcards": job.wildcards,
+            "reason": job.reason,
+            "resources": job.resources,
+            "shellcmd": job.shellcmd,
+            "priority": job.priority,
+            "group_id": job.group_id,
+        }
+
+    def _new_job_dto(
+        self, job_id: int, workflow_id: UUID, rule_id: int, job: CreateJobDTO
+    ) -> JobDTO:
+        # Every field but the id is already known, and a new job has no files
+        return JobDTO(
+            id=job_id,
+            snakemake_id=job.snakemake_id,
+            workflow_id=workflow_id,
+            rule_id=rule_id,
+            status=job.status,
+            threads=job.threads,
+            started_at=job.started_at,
+            message=job.message,
+            wildcards=job.wildcards,
+            reason=job.reason,
+            resources=job.resources,
+            shellcmd=job.shellcmd,
+            priority=job.priority,
+            group_id=job.group_id,
+        )
+
+    async def create_jobs_bulk(
+        self, workflow_id: UUID, rule_id: int, jobs: List[CreateJobDTO]
+    ) -> Optional[List[JobDTO]]:
+        async with self._session() as session:
             # Verify rule belongs to workflow
-            stmt = select(Rule).where(
+            stmt = select(Rule.id).where(
                 and_(Rule.id == rule_id, Rule.workflow_id == workflow_id)
             )
             result = await session.execute(stmt)
-            if not result.scalar_one_or_none():
+            if result.scalar_one_or_none() is None:
                 return None
 
-            new_job = Job(
-                snakemake_id=job.snakemake_id,
-                workflow_id=workflow_id,
-                rule_id=rule_id,
-                status=job.status,
-                threads=job.threads,
-                started_at=job.started_at,
-                message=job.message,
-                wildcards=job.wildcards,
-                reason=job.reason,
-                resources=job.resources,
-                shellcmd=job.shellcmd,
-                priority=job.priority,
-                group_id=job.group_id,
+            if not jobs:
+                return []
+
+            # One batched INSERT and one commit for the whole batch; the ids
+            # come back in the order of the jobs
+            result = await session.execute(
+                insert(Job).returning(Job.id, sort_by_parameter_order=True),
+                [self._job_values(workflow_id, rule_id, job) for job in jobs],
             )
-            session.add(new_job)
-            await session.commit()
-            await session.refresh(new_job)
-            return self._job_to_dto(new_job)
+            job_ids = result.scalars().all()
+            await self._commit(session)
+            return [
+                self._new_job_dto(job_id, workflow_id, rule_id, job)
+                for job_id, job in zip(job_ids, jobs)
+            ]
 
     async def get_job(self, workflow_id: UUID, job_id: int) -> Optional[JobDTO]:
-        async with self.async_session() as session:
-            stmt = select(Job).where(
-                and_(Job.id == job_id, Job.workflow_id == workflow_id)
+        async with self._session() as session:
+            result = await session.execute(
+                _JOB_BY_ID, {"job_id": job_id, "workflow_id": workflow_id}
             )
-            result = await session.execute(stmt)
             job = result.scalar_one_or_none()
             return self._job_to_dto(job) if job else None
 
     async def update_job(
         self, workflow_id: UUID, rule_id: int, job_id: int, update: UpdateJobDTO
     ) -> Optional[JobDTO]:
-        async with self.async_session() as session:
-            stmt = select(Job).where(
-                and_(
-                    Job.id == job_id,
-                    Job.workflow_id == workflow_id,
-                    Job.rule_id == rule_id,
-                )
-            )
-            result = await session.execute(stmt)
+        values: Dict[str, Any] = {}
+        if update.status is not None:
+            values["status"] = update.status
+        if update.end_time is not None:
+            values["end_time"] = update.end_time
+
+        criteria = and_(
+            Job.id == job_id, Job.workflow_id == workflow_id, Job.rule_id == rule_id
+        )
+        async with self._session() as session:
+            stmt: Executable
+            if values:
+                # The WHERE clause doubles as the ownership check, and
+                # RETURNING hands back the updated row
+                stmt = sql_update(Job).where(criteria).values(**values).returning(Job)
+            else:
+                stmt = select(Job).where(criteria)
+            result = await session.execute(stmt.options(selectinload(Job.files)))
             job = result.scalar_one_or_none()
 
             if not job:
                 return None
 
-            if update.status is not None:
-                job.status = update.status
-            if update.end_time is not None:
-                job.end_time = update.end_time
-
-            await session.commit()
-            await session.refresh(job)
+            await self._commit(session)
             return self._job_to_dto(job)
 
     async def create_file(
         self, workflow_id: UUID, job_id: int, file: CreateFileDTO
     ) -> Optional[FileDTO]:
-        async with self.async_session() as session:
+        async with self._session() as session:
+            # Only inserts if the job belongs to the workflow. RETURNING hands
+            # back the new id without re-reading the row
+            result = await session.execute(
+                _insert_from_parent(
+                    File,
+                    {"job_id": job_id, "path": file.path, "file_type": file.file_type},
+                    Job.id == job_id,
+                    Job.workflow_id == workflow_id,
+                ).returning(File.id)
+            )
+            file_id = result.scalar_one_or_none()
+            if file_id is None:
+                return None
+            await self._commit(session)
+            return FileDTO(
+                id=file_id, job_id=job_id, path=file.path, file_type=file.file_type
+            )
+
+    async def create_files_bulk(
+        self, workflow_id: UUID, job_id: int, files: List[CreateFileDTO]
+    ) -> Optional[List[FileDTO]]:
+        async with self._session() as session:
             # Verify job belongs to workflow
-            stmt = select(Job).where(
+            stmt = select(Job.id).where(
                 and_(Job.id == job_id, Job.workflow_id == workflow_id)
             )
             result = await session.execute(stmt)
-            if not result.scalar_one_or_none():
+            if result.scalar_one_or_none() is None:
                 return None
 
-            new_file = File(job_id=job_id, path=file.path, file_type=file.file_type)
-            session.add(new_file)
-            await session.commit()
-            await session.refresh(new_file)
-            return self._file_to_dto(new_file)
+            if not files:
+                return []
 
-    def _workflow_to_dto(self, workflow: Workflow) -> WorkflowDTO:
+            # One batched INSERT and one commit for the whole batch; the ids
+            # come back in the order of the files
+            result = await session.execute(
+                insert(File).returning(File.id, sort_by_parameter_order=True),
+                [
+                    {"job_id": job_id, "path": f.path, "file_type": f.file_type}
+                    for f in files
+                ],
+            )
+            file_ids = result.scalars().all()
+            await self._commit(session)
+            return [
+                FileDTO(id=file_id, job_id=job_id, path=f.path, file_type=f.file_type)
+                for file_id, f in zip(file_ids, files)
+            ]
+
+    def _workflow_to_dto(
+        self, workflow: Union[Workflow, Row], rule_ids: Optional[List[int]] = None
+    ) -> WorkflowDTO:
+        if rule_ids is None:
+            # Only ORM workflows come without rule ids, with rules eager loaded
+            rule_ids = [r.id for r in workflow.rules]
         return WorkflowDTO(
             id=workflow.id,
             status=workflow.status,
@@ -410,12 +783,24 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
             snakefile=workflow.snakefile,
             end_time=workflow.end_time,
             dryrun=workflow.dryrun,
-            rule_ids=[r.id for r in workflow.rules]
-            if hasattr(workflow, "rules") and workflow.rules
-            else [],
+            rule_ids=rule_ids,
         )
 
-    def _rule_to_dto(self, rule: Rule, job_counts: JobCounts) -> RuleDTO:
+    def _job_counts(
+        self, rule: Union[Rule, Row], status_counts: Dict[Status, int]
+    ) -> JobCounts:
+        running = status_counts[Status.RUNNING]
+        failed = status_counts[Status.ERROR]
+        success = status_counts[Status.SUCCESS]
+        return JobCounts(
+            total=rule.total_job_count,
+            running=running,
+            pending=rule.total_job_count - running - failed - success,
+            failed=failed,
+            success=success,
+        )
+
+    def _rule_to_dto(self, rule: Union[Rule, Row], job_counts: JobCounts) -> RuleDTO:
         return RuleDTO(
             id=rule.id,
             name=rule.name,
@@ -443,7 +828,7 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
             priority=job.priority,
             end_time=job.end_time,
             group_id=job.group_id,
-            files=[self._file_to_dto(f) for f in job.files],
+            files=list(map(self._file_to_dto, job.files)),
         )
 
     async def list_jobs(
@@ -457,7 +842,7 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
         order_by: str = "end_time",
         descending: bool = True,
     ) -> List[JobDTO]:
-        async with self.async_session() as session:
+        async with self._session() as session:
             stmt = (
                 select(Job)
                 .options(selectinload(Job.rule))
@@ -482,19 +867,20 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
             if offset:
                 stmt = stmt.offset(offset)
 
-            result = await session.execute(stmt)
-            jobs = result.scalars().all()
-
-            # Convert to DTOs with rule names
-            job_dtos = []
-            for job in jobs:
-                # Now job.rule is properly loaded
-                rule_name = job.rule.name if job.rule else None
-                job_dto = self._job_to_dto(job)
-                job_dto.rule_name = rule_name
-                job_dtos.append(job_dto)
-
-            return job_dtos
+            if limit:
+                # A page is small enough to fetch in one go.
+                jobs = await session.scalars(stmt)
+                return list(map(self._job_to_dto_with_rule_name, jobs))
+
+            result = await session.stream_scalars(
+                stmt.execution_options(yield_per=_STREAM_YIELD_PER)
+            )
+            return [self._job_to_dto_with_rule_name(j) async for j in result]
+
+    def _job_to_dto_with_rule_name(self, job: Job) -> JobDTO:
+        job_dto = self._job_to_dto(job)
+        job_dto.rule_name = job.rule.name if job.rule else None
+        return job_dto
 
     def _file_to_dto(self, file: File) -> FileDTO:
         return FileDTO(
@@ -5,7 +5,7 @@ from uuid import UUID
 from snkmt.types.enums import Status, FileType
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowDTO:
     id: UUID
     status: Status
@@ -29,7 +29,7 @@ class WorkflowDTO:
         return self.jobs_finished / self.total_job_count
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateWorkflowDTO:
     id: UUID
     status: Status
@@ -38,7 +38,7 @@ class UpdateWorkflowDTO:
     end_time: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobCounts:
     total: int
     running: int
@@ -47,7 +47,7 @@ class JobCounts:
     success: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleDTO:
     id: int
     name: str
@@ -64,20 +64,20 @@ class RuleDTO:
         return self.jobs_finished / self.total_job_count
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateRuleDTO:
     name: str
     total_job_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateRuleDTO:
     total_job_count: int
     jobs_finished: int
     updated_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDTO:
     id: int
     job_id: int
@@ -85,14 +85,14 @@ class FileDTO:
     file_type: FileType
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateFileDTO:
     job_id: int
     path: str
     file_type: FileType
 
 
-@dataclass
+@dataclass(slots=True)
 class JobDTO:
     id: int
     snakemake_id: int
@@ -140,7 +140,14 @@ class JobDTO:
         return self.status == Status.RUNNING
 
 
-@dataclass
+@dataclass(slots=True)
+class WorkflowTreeDTO:
+    workflow: WorkflowDTO
+    rules: List[RuleDTO] = field(default_factory=list)
+    jobs_by_rule: Dict[int, List[JobDTO]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
 class CreateJobDTO:
     snakemake_id: int
     status: Status
@@ -156,7 +163,7 @@ class CreateJobDTO:
     group_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateJobDTO:
     status: Status
     end_time: Optional[datetime] = None
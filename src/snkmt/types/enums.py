@@ -8,6 +8,16 @@ class Status(Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Codes Status is stored as in the database. Each is fixed for good: never
+# change or reuse one, give a new member the next free code.
+STATUS_CODES = {
+    Status.RUNNING: 0,
+    Status.SUCCESS: 1,
+    Status.ERROR: 2,
+    Status.UNKNOWN: 3,
+}
+
+
 class DateFilter(Enum):
     ANY = "any"
     TODAY = "today"
@@ -23,3 +33,12 @@ class FileType(Enum):
     OUTPUT = "OUTPUT"
     LOG = "LOG"
     BENCHMARK = "BENCHMARK"
+
+
+# Codes FileType is stored as in the database, fixed like STATUS_CODES
+FILE_TYPE_CODES = {
+    FileType.INPUT: 0,
+    FileType.OUTPUT: 1,
+    FileType.LOG: 2,
+    FileType.BENCHMARK: 3,
+}
@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+from time import monotonic
+import uuid
+
+from snkmt.console.views.overview import _WorkflowCache
+from snkmt.types.dto import WorkflowDTO
+from snkmt.types.enums import Status
+
+
+def new_workflow() -> WorkflowDTO:
+    now = datetime.now(timezone.utc)
+    return WorkflowDTO(
+        id=uuid.uuid4(),
+        status=Status.RUNNING,
+        name="Snakefile",
+        total_job_count=0,
+        jobs_finished=0,
+        started_at=now,
+        updated_at=now,
+    )
+
+
+def test_workflow_cache_stays_bounded():
+    """The cache never holds more than maxsize workflows, evicting the oldest."""
+    cache = _WorkflowCache(maxsize=3, ttl=60)
+    workflows = [new_workflow() for _ in range(10)]
+    for workflow in workflows:
+        cache.put(workflow)
+        assert len(cache) <= 3
+
+    assert len(cache) == 3
+    for workflow in workflows[:7]:
+        assert cache.get(workflow.id) is None
+    for workflow in workflows[7:]:
+        assert cache.get(workflow.id) is workflow
+
+
+def test_workflow_cache_refreshes_recency_on_put():
+    """Re-storing a workflow protects it from the next eviction."""
+    cache = _WorkflowCache(maxsize=2, ttl=60)
+    first, second, third = new_workflow(), new_workflow(), new_workflow()
+    cache.put(first)
+    cache.put(second)
+    cache.put(first)
+    cache.put(third)
+
+    assert cache.get(first.id) is first
+    assert cache.get(second.id) is None
+    assert cache.get(third.id) is third
+
+
+def test_workflow_cache_expires_stale_entries():
+    """Entries older than the TTL are treated as misses and dropped."""
+    cache = _WorkflowCache(maxsize=8, ttl=1.0)
+    workflow = new_workflow()
+    cache.put(workflow, fetched_at=monotonic() - 2.0)
+
+    assert cache.get(workflow.id) is None
+    assert len(cache) == 0
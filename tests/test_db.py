@@ -74,6 +74,43 @@ def test_new_database_creates_expected_tables(temp_db_path):
     db.close()
 
 
+def test_database_connections_use_wal(temp_db_path):
+    """Test that connections are tuned with WAL journaling and relaxed syncs."""
+    from sqlalchemy import text
+
+    db = Database(db_path=str(temp_db_path), create_db=True)
+
+    with db.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+    db.close()
+
+
+def test_closing_one_database_leaves_others_on_same_path_usable(temp_db_path):
+    """Test that closing a Database doesn't affect another one open on the same file."""
+    first = Database(db_path=str(temp_db_path), create_db=True)
+    second = Database(db_path=str(temp_db_path), create_db=True)
+
+    first.close()
+
+    assert second.get_revision() == get_latest_revision()
+    second.close()
+
+
+def test_database_recreates_deleted_file(temp_db_path):
+    """Test that a new Database recreates its file after the old one was deleted."""
+    db = Database(db_path=str(temp_db_path), create_db=True)
+    db.close()
+    temp_db_path.unlink()
+
+    db = Database(db_path=str(temp_db_path), create_db=True)
+
+    assert temp_db_path.exists()
+    assert db.get_revision() == get_latest_revision()
+    db.close()
+
+
 @pytest.mark.asyncio
 async def test_async_new_database_sets_latest_revision(temp_db_path):
     """Test that a new async database is set to the latest revision."""
@@ -183,3 +220,101 @@ def test_legacy_database(temp_db_path, caplog):
         )
 
         assert f"Legacy database stamped with revision: {desired_rev}" in caplog.text
+
+
+def test_database_recreates_deleted_directory(temp_db_path):
+    """Test that a new Database recreates its directory after it was removed."""
+    import shutil
+
+    db_path = temp_db_path.parent / "nested" / "test.db"
+    db = Database(db_path=str(db_path), create_db=True)
+    db.close()
+    shutil.rmtree(db_path.parent)
+
+    db = Database(db_path=str(db_path), create_db=True)
+
+    assert db_path.exists()
+    assert db.get_revision() == get_latest_revision()
+    db.close()
+
+
+def test_enum_columns_survive_smallint_migration_round_trip(temp_db_path):
+    """Test that status and file type names are converted to codes and back."""
+    import sqlite3
+    from alembic.command import upgrade, downgrade
+    from alembic.config import Config as AlembicConfig
+    from sqlalchemy import select
+    from snkmt.core.models import File, Job, Workflow
+    from snkmt.types.enums import FILE_TYPE_CODES, STATUS_CODES, FileType, Status
+
+    db = Database(db_path=str(temp_db_path), create_db=True)
+    db.close()
+
+    db_dir = Path(__file__).parent.parent / "src" / "snkmt" / "core" / "db"
+    config = AlembicConfig(db_dir / "alembic.ini")
+    config.set_main_option("script_location", str(db_dir / "alembic"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{temp_db_path}")
+
+    # Last revision that stored the enum names as text
+    before_smallint = "016452b9ddc0"
+    downgrade(config, before_smallint)
+
+    with sqlite3.connect(temp_db_path) as conn:
+        conn.executescript(
+            """
+            INSERT INTO workflows (id, status, dryrun, total_job_count, jobs_finished, started_at, updated_at)
+                VALUES ('a1', 'ERROR', 0, 2, 1, '2025-01-01', '2025-01-01');
+            INSERT INTO rules (id, name, workflow_id, updated_at, total_job_count, jobs_finished)
+                VALUES (1, 'r', 'a1', '2025-01-01', 2, 1);
+            INSERT INTO jobs (id, snakemake_id, workflow_id, rule_id, threads, status, started_at)
+                VALUES (1, 1, 'a1', 1, 1, 'SUCCESS', '2025-01-01'),
+                       (2, 2, 'a1', 1, 1, 'UNKNOWN', '2025-01-01');
+            INSERT INTO files (id, path, file_type, job_id)
+                VALUES (1, 'a.log', 'LOG', 1), (2, 'b.tsv', 'BENCHMARK', 2);
+            """
+        )
+    conn.close()
+
+    upgrade(config, "head")
+
+    with sqlite3.connect(temp_db_path) as conn:
+        assert conn.execute("SELECT status FROM workflows").fetchall() == [
+            (STATUS_CODES[Status.ERROR],)
+        ]
+        assert conn.execute("SELECT status FROM jobs ORDER BY id").fetchall() == [
+            (STATUS_CODES[Status.SUCCESS],),
+            (STATUS_CODES[Status.UNKNOWN],),
+        ]
+        assert conn.execute("SELECT file_type FROM files ORDER BY id").fetchall() == [
+            (FILE_TYPE_CODES[FileType.LOG],),
+            (FILE_TYPE_CODES[FileType.BENCHMARK],),
+        ]
+    conn.close()
+
+    db = Database(db_path=str(temp_db_path), create_db=False)
+    session = db.get_session()
+    assert session.scalars(select(Workflow.status)).all() == [Status.ERROR]
+    assert session.scalars(select(Job.status).order_by(Job.id)).all() == [
+        Status.SUCCESS,
+        Status.UNKNOWN,
+    ]
+    assert session.scalars(select(File.file_type).order_by(File.id)).all() == [
+        FileType.LOG,
+        FileType.BENCHMARK,
+    ]
+    session.close()
+    db.close()
+
+    downgrade(config, before_smallint)
+
+    with sqlite3.connect(temp_db_path) as conn:
+        assert conn.execute("SELECT status FROM workflows").fetchall() == [("ERROR",)]
+        assert conn.execute("SELECT status FROM jobs ORDER BY id").fetchall() == [
+            ("SUCCESS",),
+            ("UNKNOWN",),
+        ]
+        assert conn.execute("SELECT file_type FROM files ORDER BY id").fetchall() == [
+            ("LOG",),
+            ("BENCHMARK",),
+        ]
+    conn.close()
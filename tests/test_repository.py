@@ -0,0 +1,341 @@
+import pytest
+import pytest_asyncio
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import tempfile
+import uuid
+
+from sqlalchemy import event
+
+from snkmt.core.db.session import AsyncDatabase
+from snkmt.types.dto import (
+    CreateFileDTO,
+    CreateJobDTO,
+    CreateRuleDTO,
+    WorkflowDTO,
+)
+from snkmt.types.enums import FileType, Status
+
+
+@pytest_asyncio.fixture
+async def async_db():
+    """Create an async database in a temporary directory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = AsyncDatabase(db_path=str(Path(temp_dir) / "test.db"), create_db=True)
+        yield db
+        await db.close()
+
+
+@pytest.fixture
+def repo(async_db):
+    return async_db.get_workflow_repository()
+
+
+def new_workflow(**kwargs) -> WorkflowDTO:
+    now = datetime.now(timezone.utc)
+    fields = dict(
+        id=uuid.uuid4(),
+        status=Status.RUNNING,
+        name="Snakefile",
+        total_job_count=0,
+        jobs_finished=0,
+        started_at=now,
+        updated_at=now,
+        snakefile="Snakefile",
+    )
+    fields.update(kwargs)
+    return WorkflowDTO(**fields)
+
+
+def new_job(snakemake_id: int, status: Status = Status.RUNNING) -> CreateJobDTO:
+    return CreateJobDTO(
+        snakemake_id=snakemake_id,
+        status=status,
+        threads=1,
+        started_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_nested_transactions_commit_once(async_db, repo):
+    """Test that calls inside nested transaction() blocks share one commit."""
+    commits = []
+    event.listen(async_db.engine.sync_engine, "commit", lambda conn: commits.append(1))
+    workflow = new_workflow()
+
+    async with repo.transaction():
+        await repo.create(workflow)
+        async with repo.transaction():
+            rule_id = await repo.create_rule(workflow.id, CreateRuleDTO(name="a"))
+            job = await repo.create_job(workflow.id, rule_id, new_job(1))
+        # Writes made in the inner block are visible before the commit
+        assert (await repo.get_job(workflow.id, job.id)) is not None
+        assert commits == []
+
+    assert commits == [1]
+    assert (await repo.get(workflow.id)).rule_ids == [rule_id]
+
+
+@pytest.mark.asyncio
+async def test_transaction_rolls_back_everything_when_inner_call_raises(
+    async_db, repo
+):
+    """Test that an exception in a nested block rolls back the outer block's writes too."""
+    workflow = new_workflow()
+    # A second repository on the same database joins the same transaction
+    other_repo = async_db.get_workflow_repository()
+
+    with pytest.raises(RuntimeError):
+        async with repo.transaction():
+            await repo.create(workflow)
+            async with other_repo.transaction():
+                await other_repo.create_rule(workflow.id, CreateRuleDTO(name="a"))
+                raise RuntimeError("boom")
+
+    assert await repo.get(workflow.id) is None
+    assert await repo.list_rules(workflow.id) == []
+
+
+@pytest.mark.asyncio
+async def test_rule_progress_is_readable_and_filterable(async_db, repo):
+    """Test that rule progress is computed in Python and in SQL as jobs finish."""
+    from sqlalchemy import select
+    from snkmt.core.models import Rule
+    from snkmt.types.dto import UpdateRuleDTO
+
+    # Not yet flushed, so only the Python side can answer
+    assert Rule(total_job_count=4, jobs_finished=1).progress == 0.25
+    assert Rule().progress == 0.0
+
+    workflow = new_workflow()
+    await repo.create(workflow)
+    done = await repo.create_rule(workflow.id, CreateRuleDTO(name="done", total_job_count=4))
+    idle = await repo.create_rule(workflow.id, CreateRuleDTO(name="idle", total_job_count=4))
+    await repo.update_rule(
+        workflow.id,
+        done,
+        UpdateRuleDTO(total_job_count=4, jobs_finished=3, updated_at=None),
+    )
+
+    async with async_db.get_session()() as session:
+        rules = (
+            await session.scalars(select(Rule).where(Rule.progress > 0.5))
+        ).all()
+        assert [(rule.id, rule.progress) for rule in rules] == [(done, 0.75)]
+
+    rules = await repo.list_rules(workflow.id, order_by="progress", descending=True)
+    assert [rule.id for rule in rules] == [done, idle]
+
+
+@pytest.mark.asyncio
+async def test_create_jobs_bulk_returns_jobs_in_order(repo):
+    """Test that bulk-created jobs come back as DTOs, in the order given."""
+    workflow = new_workflow()
+    await repo.create(workflow)
+    rule_id = await repo.create_rule(workflow.id, CreateRuleDTO(name="a"))
+    jobs = [new_job(i, Status.SUCCESS if i % 2 else Status.RUNNING) for i in (5, 3, 9)]
+
+    created = await repo.create_jobs_bulk(workflow.id, rule_id, jobs)
+
+    assert [job.snakemake_id for job in created] == [5, 3, 9]
+    assert [job.status for job in created] == [job.status for job in jobs]
+    assert all(job.rule_id == rule_id for job in created)
+    ids = [job.id for job in created]
+    assert ids == sorted(ids) and len(set(ids)) == 3
+    for job in created:
+        stored = await repo.get_job(workflow.id, job.id)
+        assert (stored.snakemake_id, stored.status) == (job.snakemake_id, job.status)
+
+    assert await repo.create_jobs_bulk(workflow.id, rule_id, []) == []
+
+
+@pytest.mark.asyncio
+async def test_create_jobs_bulk_rejects_rule_of_other_workflow(repo):
+    """Test that bulk job creation returns None and writes nothing for a foreign rule."""
+    workflow, other = new_workflow(), new_workflow()
+    await repo.create(workflow)
+    await repo.create(other)
+    rule_id = await repo.create_rule(workflow.id, CreateRuleDTO(name="a"))
+
+    assert await repo.create_jobs_bulk(other.id, rule_id, [new_job(1)]) is None
+    assert await repo.create_jobs_bulk(workflow.id, rule_id + 1, [new_job(1)]) is None
+    assert await repo.list_rule_jobs(workflow.id, rule_id) == []
+
+
+@pytest.mark.asyncio
+async def test_create_files_bulk_returns_files_in_order(repo):
+    """Test that bulk-created files come back as DTOs, in order, and a foreign job is rejected."""
+    workflow, other = new_workflow(), new_workflow()
+    await repo.create(workflow)
+    await repo.create(other)
+    rule_id = await repo.create_rule(workflow.id, CreateRuleDTO(name="a"))
+    job = await repo.create_job(workflow.id, rule_id, new_job(1))
+    files = [
+        CreateFileDTO(job_id=job.id, path=path, file_type=file_type)
+        for path, file_type in [
+            ("out.txt", FileType.OUTPUT),
+            ("a.log", FileType.LOG),
+            ("in.txt", FileType.INPUT),
+        ]
+    ]
+
+    created = await repo.create_files_bulk(workflow.id, job.id, files)
+
+    assert [(f.path, f.file_type, f.job_id) for f in created] == [
+        (f.path, f.file_type, job.id) for f in files
+    ]
+    ids = [f.id for f in created]
+    assert ids == sorted(ids) and len(set(ids)) == 3
+    stored = await repo.get_job(workflow.id, job.id)
+    assert sorted((f.id, f.path) for f in stored.files) == [
+        (f.id, f.path) for f in created
+    ]
+
+    assert await repo.create_files_bulk(other.id, job.id, files) is None
+    assert len((await repo.get_job(workflow.id, job.id)).files) == 3
+    assert await repo.create_files_bulk(workflow.id, job.id, []) == []
+
+
+@pytest.mark.asyncio
+async def test_get_workflow_tree_loads_rules_jobs_and_files(repo):
+    """Test that the workflow tree holds every rule with its jobs and their files."""
+    workflow = new_workflow(total_job_count=3)
+    await repo.create(workflow)
+    align = await repo.create_rule(workflow.id, CreateRuleDTO(name="align", total_job_count=2))
+    report = await repo.create_rule(workflow.id, CreateRuleDTO(name="report", total_job_count=1))
+    ok, failed = await repo.create_jobs_bulk(
+        workflow.id, align, [new_job(1, Status.SUCCESS), new_job(2, Status.ERROR)]
+    )
+    await repo.create_files_bulk(
+        workflow.id,
+        failed.id,
+        [
+            CreateFileDTO(job_id=failed.id, path="align.log", file_type=FileType.LOG),
+            CreateFileDTO(job_id=failed.id, path="aln.bam", file_type=FileType.OUTPUT),
+        ],
+    )
+
+    tree = await repo.get_workflow_tree(workflow.id)
+
+    assert tree.workflow.id == workflow.id
+    assert sorted(tree.workflow.rule_ids) == sorted([align, report])
+    rules = {rule.name: rule for rule in tree.rules}
+    assert rules.keys() == {"align", "report"}
+    assert (rules["align"].job_counts.success, rules["align"].job_counts.failed) == (1, 1)
+    assert rules["report"].job_counts.pending == 1
+    jobs = {job.id: job for job in tree.jobs_by_rule[align]}
+    assert jobs.keys() == {ok.id, failed.id}
+    assert jobs[ok.id].files == []
+    assert sorted(f.path for f in jobs[failed.id].files) == ["align.log", "aln.bam"]
+    assert tree.jobs_by_rule[report] == []
+
+    # A status filter keeps only matching jobs and the rules that have any
+    tree = await repo.get_workflow_tree(workflow.id, Status.ERROR)
+    assert [rule.id for rule in tree.rules] == [align]
+    assert [job.id for job in tree.jobs_by_rule[align]] == [failed.id]
+
+    assert await repo.get_workflow_tree(uuid.uuid4()) is None
+
+
+async def query_plans(async_db, call) -> str:
+    """Run a repository call and return the EXPLAIN QUERY PLAN of every SELECT it issued."""
+    import sqlite3
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = async_db.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await call
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    with sqlite3.connect(async_db.db_path) as conn:
+        plans = [
+            row[3]
+            for statement, parameters in statements
+            for row in conn.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+        ]
+    conn.close()
+    return "\n".join(plans)
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_use_indexes(async_db, repo):
+    """Test that the queries behind the TUI refresh loop are served by indexes."""
+    workflow_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+
+    plan = await query_plans(async_db, repo.list(status="running"))
+    assert "USING INDEX ix_workflows_status (status=?)" in plan
+    plan = await query_plans(async_db, repo.list(since=now))
+    assert "USING INDEX ix_workflows_updated_at (updated_at>?)" in plan
+    plan = await query_plans(async_db, repo.last_updated_at())
+    assert "USING COVERING INDEX ix_workflows_updated_at" in plan
+
+    plan = await query_plans(async_db, repo.list_rules(workflow_id, since=now))
+    assert "USING INDEX ix_rules_wf_updated (workflow_id=? AND updated_at>?)" in plan
+    plan = await query_plans(async_db, repo.list_rules(workflow_id, status=Status.ERROR))
+    assert "USING INDEX ix_rules_wf_updated (workflow_id=?)" in plan
+    assert "USING COVERING INDEX ix_jobs_rule_status (rule_id=? AND status=?)" in plan
+    plan = await query_plans(async_db, repo.last_rule_updated_at(workflow_id))
+    assert "USING COVERING INDEX ix_rules_wf_updated (workflow_id=?)" in plan
+
+    plan = await query_plans(async_db, repo.list_jobs(workflow_id))
+    assert "USING INDEX ix_jobs_wf_id (workflow_id=?)" in plan
+
+
+@pytest.mark.asyncio
+async def test_list_batches_splits_workflows_at_batch_size(repo):
+    """Test that list_batches yields full batches, then the remainder, then stops."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    workflows = [
+        new_workflow(started_at=start + timedelta(minutes=i)) for i in range(5)
+    ]
+    for workflow in workflows:
+        await repo.create(workflow)
+
+    batches = repo.list_batches(batch_size=2)
+    received = [batch async for batch in batches]
+
+    assert [len(batch) for batch in received] == [2, 2, 1]
+    assert [w.id for batch in received for w in batch] == [
+        w.id for w in reversed(workflows)
+    ]
+    assert [w.id for batch in received for w in batch] == [
+        w.id for w in await repo.list()
+    ]
+    # An exhausted stream stays exhausted
+    with pytest.raises(StopAsyncIteration):
+        await anext(batches)
+
+    # An exact multiple of the batch size has no trailing empty batch
+    received = [batch async for batch in repo.list_batches(limit=4, batch_size=2)]
+    assert [len(batch) for batch in received] == [2, 2]
+    assert [batch async for batch in repo.list_batches(name="nope")] == []
+
+
+@pytest.mark.asyncio
+async def test_list_rules_counts_jobs_across_id_chunks(repo, monkeypatch):
+    """Test that filtered rule listings count jobs for rules in every IN chunk."""
+    monkeypatch.setattr("snkmt.core.models.rule.IN_CHUNK_SIZE", 2)
+    workflow = new_workflow()
+    await repo.create(workflow)
+    rule_ids = []
+    for i in range(5):
+        rule_id = await repo.create_rule(workflow.id, CreateRuleDTO(name=f"r{i}"))
+        jobs = [new_job(j, Status.SUCCESS) for j in range(i)]
+        await repo.create_jobs_bulk(workflow.id, rule_id, jobs + [new_job(99, Status.ERROR)])
+        rule_ids.append(rule_id)
+
+    rules = await repo.list_rules(workflow.id, status=Status.ERROR)
+
+    counts = {rule.id: rule.job_counts for rule in rules}
+    assert sorted(counts) == sorted(rule_ids)
+    for i, rule_id in enumerate(rule_ids):
+        assert (counts[rule_id].success, counts[rule_id].failed) == (i, 1)